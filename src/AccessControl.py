@@ -24,7 +24,11 @@ class PublicMethods(AccessControl):
 
 		for key, value in this.kwargs.items():
 			toInject[key] = value
-		
+
+		this.AddMethods(toInject)
+
+	# Inject all the given methods at once, in the form of {target: source}.
+	def AddMethods(this, toInject):
 		for target, source in toInject.items():
 			this.parameters[target] = util.DotDict({
 				'kind': None,
@@ -32,6 +36,9 @@ class PublicMethods(AccessControl):
 				'default': inject(source)
 			})
 
+# Calling a Functor for each set of methods is expensive when defining many kinds, so we add them directly.
 def public_methods(*args, **kwargs):
 	[kwargs.update({arg: arg}) for arg in args]
-	return PublicMethods()(**kwargs)
\ No newline at end of file
+	ret = PublicMethods()
+	ret.AddMethods(kwargs)
+	return ret
@@ -42,4 +42,4 @@ class BackwardsCompatible:
 	# Support backwards compatibility, to an extent.
 	# NOTE: This may cause unwanted type conversions.
 	def Get(this, var):
-		return eval(f"this.{this.cache.compatibilities[var]}")
\ No newline at end of file
+		return util.GetAttr(this, this.cache.compatibilities[var])
\ No newline at end of file
@@ -0,0 +1,113 @@
+import os
+import logging
+import hashlib
+import marshal
+import importlib.util
+
+# CodeCache is a global singleton which remembers the code objects compiled from generated source (e.g. Method.UpdateSource and @kind).
+# Generated source never gets the benefit of __pycache__, so, without this, the same strings would be compiled in every process.
+# Code is kept in memory, keyed by its source. If a directory is set (see SetDirectory()), code is also marshalled there, named by the hash of its source, so it may be reused across runs.
+# Since the source is the key, changing it (e.g. by editing a @kind) simply produces a new entry; stale entries are never used.
+# Files written by a different version of python are ignored and replaced.
+class CodeCache:
+	def __init__(this):
+		# Singletons man...
+		if "instance" not in CodeCache.__dict__:
+			logging.debug(f"Creating new CodeCache: {this}")
+			CodeCache.instance = this
+		else:
+			return None
+
+		# Compiled code, in the form of {(source, filename, mode): code}.
+		this.code = {}
+
+		# Where to store compiled code on disk; None to only keep code in memory.
+		this.directory = None
+
+	@staticmethod
+	def Instance():
+		if "instance" not in CodeCache.__dict__:
+			CodeCache()
+		return CodeCache.instance
+
+	# Store compiled code in the given directory (e.g. next to the registry).
+	# Set to None to stop using the disk.
+	@staticmethod
+	def SetDirectory(directory):
+		if (directory is not None):
+			directory = str(directory)
+			try:
+				os.makedirs(directory, exist_ok=True)
+			except OSError as e:
+				logging.warning(f"Unable to cache compiled code in {directory}: {e}")
+				directory = None
+		CodeCache.Instance().directory = directory
+
+	# Forget all code held in memory. Code stored on disk is kept.
+	@staticmethod
+	def Clear():
+		CodeCache.Instance().code = {}
+
+	# Drop-in replacement for compile(source, filename, mode).
+	# RETURNS: the code object for source, compiling it only if it has not been compiled before.
+	@staticmethod
+	def Compile(source, filename='', mode='exec'):
+		cache = CodeCache.Instance()
+		key = (source, filename, mode)
+		code = cache.code.get(key)
+		if (code is not None):
+			return code
+
+		path = None
+		if (cache.directory is not None):
+			path = CodeCache.GetPath(cache.directory, source, filename, mode)
+			code = CodeCache.Load(path)
+
+		if (code is None):
+			code = compile(source, filename, mode)
+			if (path is not None):
+				CodeCache.Store(path, code)
+
+		cache.code[key] = code
+		return code
+
+	# RETURNS: where the code for the given source would be stored in directory.
+	@staticmethod
+	def GetPath(directory, source, filename, mode):
+		digest = hashlib.sha256(f"{mode}\0{filename}\0{source}".encode('utf-8', 'surrogatepass')).hexdigest()
+		return os.path.join(directory, f"{digest}.pyc")
+
+	# RETURNS: the code stored at path or None, if there is no usable code there.
+	@staticmethod
+	def Load(path):
+		try:
+			with open(path, 'rb') as file:
+				data = file.read()
+		except OSError:
+			return None
+
+		magic = importlib.util.MAGIC_NUMBER
+		if (not data.startswith(magic)):
+			return None
+
+		try:
+			return marshal.loads(data[len(magic):])
+		except (EOFError, ValueError, TypeError) as e:
+			logging.debug(f"Ignoring invalid compiled code in {path}: {e}")
+			return None
+
+	# Write code to path, such that readers never see a partial file.
+	@staticmethod
+	def Store(path, code):
+		temporary = f"{path}.{os.getpid()}.tmp"
+		try:
+			with open(temporary, 'wb') as file:
+				file.write(importlib.util.MAGIC_NUMBER)
+				file.write(marshal.dumps(code))
+			os.replace(temporary, path)
+		except (OSError, ValueError) as e:
+			logging.debug(f"Unable to store compiled code in {path}: {e}")
+			try:
+				os.remove(temporary)
+			except OSError:
+				pass
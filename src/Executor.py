@@ -19,6 +19,10 @@ from .Recoverable import recoverable
 from .Utils import util
 from .ExecutorTracker import ExecutorTracker
 from .FunctorTracker import FunctorTracker
+from .FetchCache import FetchCache
+from .CodeCache import CodeCache
+from .FetchProfiler import FetchProfiler
+from .Trace import Trace
 from .Namespace import Namespace
 
 # Executor: a base class for user interfaces.
@@ -77,6 +81,10 @@ class Executor(DataContainer, Functor):
 		# This is used in Execute().
 		this.cache.functors = {}
 
+		# Idle Functors which Execute() may reuse, in the form of {name: [Functor]}.
+		# Each Functor is only used by one Execute() at a time; see CheckoutFunctor() and ReturnFunctor().
+		this.cache.pool = {}
+
 		# General system info
 		this.cwd = os.getcwd()
 		this.syspath = sys.path
@@ -143,6 +151,13 @@ class Executor(DataContainer, Functor):
 		this.default.package = util.DotDict()
 		this.default.package.type = ""
 
+		# Settings for the Functors kept by Execute().
+		this.default.pool = util.DotDict()
+
+		# How many idle Functors of each name Execute() may keep for reuse.
+		# Set to 0 to construct a new Functor for every Execute().
+		this.default.pool.size = 4
+
 		# Configuration ingestion settings.
 		this.default.config = util.DotDict()
 		
@@ -159,9 +174,30 @@ class Executor(DataContainer, Functor):
 			"py",
 		]
 
+		# Environment variable settings.
+		this.default.environment = util.DotDict()
+
+		# If set, only environment variables starting with this prefix (e.g. 'EONS_') may be Fetched.
+		# The prefix is optional when Fetching: with 'EONS_', both Fetch('EONS_VERBOSITY') and Fetch('verbosity') will find EONS_VERBOSITY.
+		# Call RefreshEnvironment() after changing this.
+		this.default.environment.prefix = ""
+
+		# The environment is read once (see RefreshEnvironment) and cached here.
+		this.cache.environment = util.DotDict()
+		this.cache.environment.variables = {}
+		this.cache.environment.lookup = {}
+
+		# Incremented whenever the args, config, globals, or environment of *this change.
+		# Warm Functors include this in their call fingerprint, so they WarmUp again after such changes (see Functor.GetCallFingerprint()).
+		this.generation = 0
+
 		# We can't Fetch from everywhere while we're getting things going. However, these should be safe,
 		this.fetch.useDuringSetup = ['args', 'config', 'environment']
 
+		# How to report what the FetchProfiler recorded: None (don't profile), 'table', or 'json'.
+		# Set with --fetch-profile; the report is logged when *this is done, or written to --fetch-profile-file.
+		this.fetch.profile = None
+
 		# Because Elderlang derives from eons, we cannot provide out-of-the-box support for .ldr files and Elder logic.
 		# However, we can lay the groundwork for other Executors to be "elder-enabled".
 		# We make that process easy by only requiring that this.elder be set.
@@ -184,6 +220,7 @@ class Executor(DataContainer, Functor):
 		})
 
 		this.Configure()
+		this.RefreshEnvironment()
 		this.RegisterIncludedClasses()
 		this.AddArgs()
 		this.ResetPlacementSession()
@@ -230,6 +267,49 @@ class Executor(DataContainer, Functor):
 
 		this.asyncSession = FuturesSession()
 
+	# Take a new snapshot of the environment.
+	# Fetch will not see changes made to the environment (e.g. os.environ['foo'] = 'bar') until this is called.
+	def RefreshEnvironment(this):
+		prefix = this.default.environment.prefix
+		variables = {}
+		for key, value in os.environ.items():
+			if (not key.startswith(prefix)):
+				continue
+			variables[key] = value
+			if (prefix):
+				variables.setdefault(key[len(prefix):], value)
+
+		this.cache.environment.variables = variables
+		this.cache.environment.lookup = {}
+		FetchCache.ForgetMisses('environment')
+		this.generation += 1
+		FetchCache.Invalidate()
+
+
+	# Look up a variable in the environment snapshot.
+	# Like os.getenv, the exact name is preferred; otherwise, the upper case name is used.
+	# Each varName is resolved once, after which both hits and misses cost a single dict lookup.
+	# RETURNS: a tuple of the value of the variable (or default) and whether or not it was found.
+	def GetEnvironmentVariable(this, varName, default=None):
+		try:
+			value, found = this.cache.environment.lookup[varName]
+		except KeyError:
+			variables = this.cache.environment.variables
+			found = True
+			if (varName in variables):
+				value = variables[varName]
+			elif (varName.upper() in variables):
+				value = variables[varName.upper()]
+			else:
+				found = False
+				value = None
+			this.cache.environment.lookup[varName] = (value, found)
+
+		if (not found):
+			return default, False
+		return value, True
+
+
 	# Add a place to search for SelfRegistering classes.
 	# These should all be relative to the invoking working directory (i.e. whatever './' is at time of calling Executor())
 	def RegisterDirectory(this, directory):
@@ -465,6 +545,8 @@ class Executor(DataContainer, Functor):
 	def PopulateConfig(this):
 		this.config = None
 		this.configType = None
+		this.generation += 1
+		FetchCache.Invalidate()
 
 		if (this.parsedArgs.config is None):
 			for file in this.default.config.files:
@@ -492,6 +574,8 @@ class Executor(DataContainer, Functor):
 		configFile = open(this.parsedArgs.config, "r")
 		this.config = this.ParseConfigFile(this, this.configType, configFile, configFunctor)
 		configFile.close()
+		this.generation += 1
+		FetchCache.Invalidate()
 
 
 	#  Get information for how to download packages.
@@ -504,10 +588,19 @@ class Executor(DataContainer, Functor):
 			"username": None,
 			"password": None
 		}
-		for key, default in details.items():
-			this.repo[key] = this.Fetch(f"repo_{key}", default=default)
+		fetched = this.FetchMany([f"repo_{key}" for key in details.keys()], {f"repo_{key}": default for key, default in details.items()})
+		for key in details.keys():
+			this.repo[key] = fetched[f"repo_{key}"]
 	
 
+	# Keep the code compiled for @kinds and @methods next to the registry, if requested (e.g. --code-cache True).
+	# See CodeCache.py for details.
+	def SetCodeCache(this):
+		if (not this.EvaluateToType(this.Fetch('code_cache', False, this.fetch.useDuringSetup))):
+			return
+		CodeCache.SetDirectory(Path(this.repo.registry).parent.joinpath('bytecode'))
+
+
 	# Get information for interacting with Constellatus
 	def PopulateObservatoryDetails(this):
 		details = {
@@ -516,8 +609,9 @@ class Executor(DataContainer, Functor):
 			"username": None,
 			"password": None
 		}
-		for key, default in details.items():
-			this.observatory[key] = this.Fetch(f"observatory_{key}", default=default)
+		fetched = this.FetchMany([f"observatory_{key}" for key in details.keys()], {f"observatory_{key}": default for key, default in details.items()})
+		for key in details.keys():
+			this.observatory[key] = fetched[f"observatory_{key}"]
 
 	# How do we get the verbosity level and what do we do with it?
 	# This method should set log levels, etc.
@@ -547,6 +641,38 @@ class Executor(DataContainer, Functor):
 			logging.getLogger('urllib3').setLevel(logging.DEBUG)
 
 
+	# Start profiling Fetch, if requested.
+	# See FetchProfiler.py for details.
+	def SetFetchProfile(this):
+		this.fetch.profile = this.EvaluateToType(this.Fetch('fetch_profile', None, this.fetch.useDuringSetup))
+		if (this.fetch.profile):
+			FetchProfiler.Enable()
+
+
+	# Report what the FetchProfiler has recorded.
+	# format may be 'table' or 'json'; by default, the format given by --fetch-profile is used.
+	# RETURNS: the report or None, if there is nothing to report.
+	def ReportFetchProfile(this, format=None):
+		if (format is None):
+			format = this.fetch.profile
+		if (not format):
+			return None
+
+		if (str(format).lower() == 'json'):
+			report = FetchProfiler.GetJson()
+		else:
+			report = FetchProfiler.GetTable()
+
+		reportFile = this.Fetch('fetch_profile_file', None, this.fetch.useDuringSetup)
+		if (reportFile):
+			with open(reportFile, 'w') as file:
+				file.write(report)
+			logging.info(f"Wrote Fetch profile to {reportFile}")
+		else:
+			logging.info(f"Fetch profile:\n{report}")
+		return report
+
+
 	# Do the argparse thing.
 	# Extra arguments are converted from --this-format to this_format, without preceding dashes. For example, --repo-url ... becomes repo_url ...
 	# NOTE: YOU CANNOT USE @recoverable METHODS HERE!
@@ -571,6 +697,8 @@ class Executor(DataContainer, Functor):
 			extraArgsValues.append(extraArgs[index])
 
 		this.extraArgs = dict(zip(extraArgsKeys, extraArgsValues))
+		this.generation += 1
+		FetchCache.Invalidate()
 
 
 	# Functor method.
@@ -585,10 +713,12 @@ class Executor(DataContainer, Functor):
 		this.PopulateConfig()
 		this.SetVerbosity()
 		this.SetLogFile()
+		this.SetFetchProfile()
 		logging.debug(f"<---- {this.name} (log level: {logging.getLogger().level}) ---->")
 		logging.debug(f"Got extra arguments: {this.extraArgs}") # has to be after verbosity setting
 		logging.debug(f"Got config contents: {this.config}")
 		this.PopulateRepoDetails()
+		this.SetCodeCache()
 		this.PopulateObservatoryDetails()
 		this.placement.max = this.Fetch('placement_max', 255, this.fetch.useDuringSetup)
 
@@ -610,6 +740,7 @@ class Executor(DataContainer, Functor):
 
 	# Close out anything we left open.
 	def AfterFunction(this):
+		this.ReportFetchProfile()
 		this.TeardownLogging()
 
 
@@ -635,21 +766,52 @@ class Executor(DataContainer, Functor):
 	
 
 	# Execute a Functor based on name alone (not object).
-	# If the given Functor has been Executed before, the cached Functor will be called again. Otherwise, a new Functor will be constructed.
+	# If the given Functor has been Executed before, an idle Functor from the pool will be called again. Otherwise (or if all are in use, e.g. when Executing recursively), a new Functor will be constructed.
+	# Functors which are returned to the caller (e.g. by autoReturn) are the caller's to keep, so they are never given out again.
+	# See CheckoutFunctor() and default.pool for details.
 	@recoverable
 	def Execute(this, functor, *args, **kwargs):
-		if (isinstance(functor, str)):
+		pooled = isinstance(functor, str)
+		if (pooled):
 			functorName = functor
 			packageType = this.default.package.type
 			if ('packageType' in kwargs):
 				packageType = kwargs.pop('packageType')
-			functor = this.GetRegistered(functorName, packageType)
+			functor = this.CheckoutFunctor(functorName, packageType)
 		else:
 			functorName = functor.name
 
-		logging.debug(f"Executing {functorName}({', '.join([str(a) for a in args] + [k+'='+str(v) for k,v in kwargs.items()])})")
+		if (Trace.Enabled(this, logging.DEBUG)):
+			Trace.Event(this, logging.DEBUG, 'execute', "Executing {functor}({arguments})", functor=functorName, arguments=', '.join([str(a) for a in args] + [k+'='+str(v) for k,v in kwargs.items()]))
 		this.cache.functors.update({functorName: functor})
-		return functor(*args, **kwargs, executor=this)
+
+		ret = None
+		try:
+			ret = functor(*args, **kwargs, executor=this)
+			return ret
+		finally:
+			# Functors which were returned (e.g. by autoReturn) now belong to whoever we returned them to; giving them out again would overwrite the result they hold.
+			# The same goes for incomplete Functors, which are waiting to be called again.
+			if (pooled and ret is not functor and not functor.incomplete):
+				this.ReturnFunctor(functorName, functor)
+
+
+	# Take an idle Functor from the pool, or construct a new one if there are none.
+	# The Functor returned will not be given out again until it is passed to ReturnFunctor().
+	# RETURNS: a Functor of the given name.
+	def CheckoutFunctor(this, functorName, packageType=""):
+		try:
+			return this.cache.pool[functorName].pop()
+		except (KeyError, IndexError):
+			return this.GetRegistered(functorName, packageType, cached=False)
+
+
+	# Give a Functor from CheckoutFunctor() back to the pool, so that it may be reused.
+	# Functors beyond default.pool.size are dropped.
+	def ReturnFunctor(this, functorName, functor):
+		idle = this.cache.pool.setdefault(functorName, [])
+		if (len(idle) < this.default.pool.size):
+			idle.append(functor)
 
 
 	# Attempts to download the given package from the repo url specified in calling args.
@@ -778,13 +940,15 @@ class Executor(DataContainer, Functor):
 	# RETURNS and instance of a Datum, Functor, etc. (aka modules) which has been discovered by a prior call of RegisterAllClassesInDirectory()
 	# Will attempt to register existing modules if one of the given name is not found. Failing that, the given package will be downloaded if it can be found online.
 	# Both python modules and other eons modules of the same packageType will be installed automatically in order to meet all required dependencies of the given module.
+	# If cached, the Functor last Executed with the given name will be returned, if there is one.
 	@recoverable
 	def GetRegistered(this,
 		registeredName,
 		packageType="",
-		namespace=None):
+		namespace=None,
+		cached=True):
 
-		if (registeredName in this.cache.functors):
+		if (cached and registeredName in this.cache.functors):
 				return this.cache.functors[registeredName]
 
 		if (packageType):
@@ -830,16 +994,22 @@ class Executor(DataContainer, Functor):
 
 		SelfRegistering.RegisterAllClassesInDirectory(directory, recurse=recurse, elder=this.elder)
 
+		# Newly loaded classes may replace those we know about.
+		Functor.ClearCaches()
+
 
 	# Set a global value for use throughout all python modules.
 	def SetGlobal(this, name, value, setFromFetch=False):
 		# In cause the value was accessed with ".", we need to cast it to a DotDict.
-		if (isinstance(value, dict)):
+		if (isinstance(value, dict) and not isinstance(value, util.DotDictView)):
 			value = util.DotDict(value)
 
 		logging.debug(f"Setting global value {name} = {value}")
 		setattr(builtins, name, value)
 		this.globals.update({name: setFromFetch})
+		FetchCache.ForgetMisses('globals')
+		this.generation += 1
+		FetchCache.Invalidate(name)
 
 
 	# Move a value from Fetch to globals.
@@ -874,6 +1044,9 @@ class Executor(DataContainer, Functor):
 		except Exception as e:
 			logging.error(f"Failed to expire {toExpire}: {e}")
 		# Carry on.
+		FetchCache.ForgetMisses('globals')
+		this.generation += 1
+		FetchCache.Invalidate(toExpire)
 
 
 	# Remove all the globals *this has created.
@@ -933,9 +1106,13 @@ class Executor(DataContainer, Functor):
 	######## START: Fetch Locations ########
 
 	def fetch_location_args(this, varName, default, fetchFrom, attempted):
-		for key, val in this.extraArgs.items():
-			if (key == varName):
-				return val, True
+		if (this.extraArgs and varName in this.extraArgs):
+			return this.extraArgs[varName], True
 		return default, False
 
+	def fetch_many_location_args(this, varNames, defaults, fetchFrom, attempted):
+		if (not this.extraArgs):
+			return {}
+		return {varName: this.extraArgs[varName] for varName in varNames if varName in this.extraArgs}
+
 	######## END: Fetch Locations ########
@@ -0,0 +1,76 @@
+import logging
+
+# FetchCache is a global singleton which tracks whether or not cached Fetch results are still valid.
+# Anything that might change the result of a Fetch (e.g. Functor.Set, Executor.SetGlobal) should call FetchCache.Invalidate().
+# Invalidating is cheap: it just bumps the generation. Cached results from an older generation are ignored.
+# Caches which are kept per varName (e.g. Functor.cache.attr) may instead check GetVersion(), so that changing one varName does not drop what was cached for the others.
+# See Functor.feature.fetch.cache for how to enable Fetch caching.
+class FetchCache:
+	def __init__(this):
+		# Singletons man...
+		if "instance" not in FetchCache.__dict__:
+			logging.debug(f"Creating new FetchCache: {this}")
+			FetchCache.instance = this
+		else:
+			return None
+
+		this.generation = 0
+
+		# The epoch changes whenever something other than a single varName changes (e.g. a config is loaded).
+		# Each top level varName also has its own version, in the form of {varName: int}, which changes whenever that varName does.
+		# See GetVersion().
+		this.epoch = 0
+		this.versions = {}
+
+		# Process-wide locations (e.g. globals & environment) also remember which varNames they do not have, in the form of {location: set(varNames)}.
+		# Unlike cached results, these misses are not forgotten when the generation changes, only when the location itself changes (see ForgetMisses()).
+		this.misses = {}
+
+	@staticmethod
+	def Instance():
+		if "instance" not in FetchCache.__dict__:
+			FetchCache()
+		return FetchCache.instance
+
+	@staticmethod
+	def GetGeneration():
+		return FetchCache.Instance().generation
+
+	# Mark all cached Fetch results as stale.
+	# If only the given varName has changed, the versions of other varNames are left as they are (see GetVersion()).
+	# Dotted names (e.g. 'service.port') change the version of their top level name (e.g. 'service').
+	@staticmethod
+	def Invalidate(varName=None):
+		instance = FetchCache.Instance()
+		instance.generation += 1
+		if (varName is None):
+			instance.epoch += 1
+			return
+		varName = varName.split('.', 1)[0]
+		instance.versions[varName] = instance.versions.get(varName, 0) + 1
+
+	# RETURNS: a tuple which changes whenever the given top level varName might Fetch something different.
+	@staticmethod
+	def GetVersion(varName):
+		instance = FetchCache.Instance()
+		return instance.epoch, instance.versions.get(varName, 0)
+
+	# RETURNS: whether or not varName is known to be missing from the given location.
+	@staticmethod
+	def IsMiss(location, varName):
+		misses = FetchCache.Instance().misses.get(location)
+		return misses is not None and varName in misses
+
+	# Remember that varName is missing from the given location.
+	@staticmethod
+	def AddMiss(location, varName):
+		FetchCache.Instance().misses.setdefault(location, set()).add(varName)
+
+	# Forget what is missing from the given location (or all locations, if None).
+	# Call this whenever the location changes (e.g. Executor.SetGlobal).
+	@staticmethod
+	def ForgetMisses(location=None):
+		if (location is None):
+			FetchCache.Instance().misses = {}
+		else:
+			FetchCache.Instance().misses.pop(location, None)
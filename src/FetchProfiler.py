@@ -0,0 +1,139 @@
+import logging
+import json
+from .Utils import util
+
+# FetchProfiler is a global singleton which records how Fetch() is used, so that fetch.use can be tuned with data instead of guesswork.
+# Profiling is off by default; when off, the only cost to Fetch is checking FetchProfiler.enabled.
+# Enable it with FetchProfiler.Enable() or, when using an Executor, with --fetch-profile table (or json).
+#
+# For each Functor class and varName, we record:
+#	calls: how many times varName was Fetched.
+#	locations: how many times each location answered.
+#	tried: how many locations were searched before the answer was found (or the default was used), in total.
+#	time: the total time spent Fetching, in seconds.
+#	defaults: how many times the default was returned.
+class FetchProfiler:
+	enabled = False
+
+	def __init__(this):
+		# Singletons man...
+		if "instance" not in FetchProfiler.__dict__:
+			logging.debug(f"Creating new FetchProfiler: {this}")
+			FetchProfiler.instance = this
+		else:
+			return None
+
+		this.records = {}
+
+		# The fetch.use of each class, when it was first recorded.
+		this.uses = {}
+
+	@staticmethod
+	def Instance():
+		if "instance" not in FetchProfiler.__dict__:
+			FetchProfiler()
+		return FetchProfiler.instance
+
+	@staticmethod
+	def Enable():
+		FetchProfiler.enabled = True
+
+	@staticmethod
+	def Disable():
+		FetchProfiler.enabled = False
+
+	# Forget everything recorded so far.
+	@staticmethod
+	def Reset():
+		FetchProfiler.Instance().records = {}
+		FetchProfiler.Instance().uses = {}
+
+	# Record the result of a single Fetch.
+	# location should be None if the default was used.
+	@staticmethod
+	def Record(source, varName, location, tried, elapsed):
+		profiler = FetchProfiler.Instance()
+		cls = source.__class__.__name__
+		try:
+			record = profiler.records[(cls, varName)]
+		except KeyError:
+			record = util.DotDict({'calls': 0, 'locations': {}, 'tried': 0, 'time': 0.0, 'defaults': 0})
+			profiler.records[(cls, varName)] = record
+			if (cls not in profiler.uses):
+				profiler.uses[cls] = list(source.fetch.use)
+
+		record.calls += 1
+		record.tried += tried
+		record.time += elapsed
+		if (location is None):
+			record.defaults += 1
+		else:
+			record.locations[location] = record.locations.get(location, 0) + 1
+
+	# Suggest a fetch.use order for each class, based on which locations answered most often.
+	# Locations which never answered keep their current order, after those that did.
+	# NOTE: the order of fetch.use also determines which value wins when a variable exists in more than one location. Check that the suggested order still gives the values you expect!
+	# RETURNS: a dict of {class name: [locations]}
+	@staticmethod
+	def Suggest():
+		profiler = FetchProfiler.Instance()
+		hits = {}
+		for (cls, varName), record in profiler.records.items():
+			clsHits = hits.setdefault(cls, {})
+			for location, count in record.locations.items():
+				clsHits[location] = clsHits.get(location, 0) + count
+
+		ret = {}
+		for cls, clsHits in hits.items():
+			order = list(profiler.uses.get(cls, []))
+			for location in clsHits.keys():
+				if (location not in order):
+					order.append(location)
+			ret[cls] = sorted(order, key=lambda location: -clsHits.get(location, 0))
+		return ret
+
+	# RETURNS: everything recorded, as a json-serializable dict.
+	@staticmethod
+	def GetReport():
+		report = {'fetches': [], 'suggestions': FetchProfiler.Suggest()}
+		for (cls, varName), record in FetchProfiler.Instance().records.items():
+			report['fetches'].append({
+				'class': cls,
+				'varName': varName,
+				'calls': record.calls,
+				'locations': dict(record.locations),
+				'tried': record.tried,
+				'time': record.time,
+				'defaults': record.defaults,
+			})
+		report['fetches'].sort(key=lambda fetch: -fetch['time'])
+		return report
+
+	# RETURNS: the report as a json string.
+	@staticmethod
+	def GetJson():
+		return json.dumps(FetchProfiler.GetReport(), indent=2)
+
+	# RETURNS: the report as a plain text table, slowest Fetches first.
+	@staticmethod
+	def GetTable():
+		report = FetchProfiler.GetReport()
+		rows = [['class', 'varName', 'calls', 'tried/call', 'time (ms)', 'defaults', 'locations']]
+		for fetch in report['fetches']:
+			rows.append([
+				fetch['class'],
+				fetch['varName'],
+				str(fetch['calls']),
+				f"{fetch['tried'] / fetch['calls']:.1f}",
+				f"{fetch['time'] * 1000:.3f}",
+				str(fetch['defaults']),
+				', '.join([f"{location}: {count}" for location, count in fetch['locations'].items()]),
+			])
+		widths = [max([len(row[column]) for row in rows]) for column in range(len(rows[0]))]
+		lines = ['  '.join([cell.ljust(width) for cell, width in zip(row, widths)]).rstrip() for row in rows]
+
+		lines.append('')
+		lines.append('Suggested fetch.use:')
+		for cls, order in report['suggestions'].items():
+			lines.append(f"  {cls}: {order}")
+		return '\n'.join(lines)
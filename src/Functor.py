@@ -1,8 +1,15 @@
 import logging
 import os
+import sys
 import shutil
 import dis, inspect
 import types
+import time
+import threading
+import functools
+import string
+import re
+import array
 from copy import deepcopy, copy
 import builtins
 from .Constants import *
@@ -13,6 +20,9 @@ from .Exceptions import *
 from .Utils import util
 from .FunctorTracker import FunctorTracker
 from .ExecutorTracker import ExecutorTracker
+from .FetchCache import FetchCache
+from .FetchProfiler import FetchProfiler
+from .Trace import Trace
 from .Recoverable import Recover
 
 # Don't import Method or Executor, even though they are required: it will cause a circular dependency.
@@ -30,6 +40,55 @@ class Functor(Datum, BackwardsCompatible):
 	# Which function should be overridden when creating a @kind from *this.
 	primaryFunctionName = 'Function'
 
+	# Set this to False or a logging level to quiet the hot path logs of a particular class.
+	# See Trace.py for details.
+	tracing = True
+
+	# Ordered Fetch location names, compiled once per class for each distinct fetch.use / include / exclude combination.
+	# Keys are (class, fetch.possibilities, current, include, exclude) tuples; see CompileFetchPlan().
+	fetchPlans = {}
+
+	# Set()ting these changes where values are Fetched from, not just what a single varName is, so all cached Fetches are invalidated (see FetchCache.Invalidate()).
+	# Fetch locations (i.e. fetch.possibilities) are always included.
+	fetchStructure = {'kwargs', 'fetch', 'result'}
+
+	# The strings EvaluateToType() may convert: booleans, and ints & floats which are written exactly as python would write them (e.g. '1' and '1.5' but not '01' or '1.50').
+	typePattern = re.compile(r"(?P<bool>[Tt][Rr][Uu][Ee]|[Ff][Aa][Ll][Ss][Ee])$|(?P<int>0|-?[1-9][0-9]*)$|(?P<float>-?(?:[0-9]+\.[0-9]+(?:e[+-][0-9]+)?|[0-9]e[+-][0-9]+|inf)|nan)$")
+
+	# Values of these types are left as they are by EvaluateToType().
+	typedValueTypes = {bool, int, float, type(None)}
+
+	# The static details of each class, as computed by Initialize(), in the form of {(class, args...): DotDict}.
+	# Instances of the same class are usually constructed identically, so the work done by the first Initialize() can be reused by the rest.
+	# See GetTemplate() for details.
+	templates = {}
+
+	# The merged method tables of each kind of Functor, in the form of {key: DotDict(id=int, table=tuple or None)}.
+	# Functors of the same class, with the same method sources (e.g. precursors of the same class, which had the same method tables themselves), always merge the same methods the same way.
+	# See GetMethodTableKey() for details.
+	methodTables = {}
+
+	# How many method tables have been created; used for their ids.
+	# Ids are never reused, even after ClearCaches(), since Functors may still hold old ones (see cache.methodTable).
+	methodTableCount = 0
+
+	# Method tables in which all required methods were found, in the form of {(class, method table id, method.required)}.
+	# See ValidateMethods() for details.
+	validMethodTables = set()
+
+	# Functions which coerce values to each type in arg.type, in the form of {type: function(functor, varName, value)}.
+	# See CompileArgCoercer() for details.
+	argCoercers = {}
+
+	# Values of these types cannot change, so coercing them to their own type does nothing, and equal values may share a typed Functor.
+	immutableValueTypes = {bool, int, float, str, bytes, tuple, frozenset, type(None)}
+
+	# While a Fetch is walking other Functors, the Fetches made by their __getattr__ (see fetch.attr.use) are remembered in fetchState.attrFetches, in the form of {(id(Functor), attribute): (value, found)}.
+	# The walk itself never calls __getattr__ (see FetchOwnAttribute()), but custom locations may; otherwise, each of those would walk the rest of the chain again.
+	# Each thread has its own state, so that concurrent Fetches don't share (or clear) each other's results.
+	# attrFetches is unset (i.e. None; see GetAttrFetches()) when no Fetch is in progress on the current thread.
+	fetchState = threading.local()
+
 	def __init__(this, name=INVALID_NAME()):
 		Datum.__init__(this, name)
 		BackwardsCompatible.__init__(this)
@@ -152,6 +211,89 @@ class Functor(Datum, BackwardsCompatible):
 		# The order of fetchLocations does not matter; the order of each fetchFrom provided to Fetch() does. This allows users to set their preferred search order for maximum efficiency.
 		this.fetch.locations = {}
 
+		# Some Fetch locations are just hops to another Functor (e.g. 'precursor' searches this.precursor).
+		# Rather than recursing through each Functor's Fetch, the Functors reachable through these hops are walked iteratively, each only once (see WalkFetchScope()).
+		# Each hop is {location: {'include': [...], 'exclude': [...]}}, where include & exclude modify the fetchFrom used when searching the Functor hopped to.
+		# The Functor to hop to is given by GetFetchHop().
+		# NOTE: overriding fetch_location_{hop} (or replacing it in fetch.locations) will cause that location to be called like any other, rather than walked.
+		this.fetch.hops = util.DotDict()
+		this.fetch.hops.epidef = util.DotDict({'include': ['this'], 'exclude': ['environment', 'globals', 'executor']})
+		this.fetch.hops.precursor = util.DotDict({'include': ['this'], 'exclude': ['environment', 'globals', 'executor']})
+		this.fetch.hops.caller = util.DotDict({'include': ['this'], 'exclude': ['environment', 'globals', 'executor']})
+		this.fetch.hops.executor = util.DotDict({'include': [], 'exclude': ['environment']})
+
+		# The maximum number of hops Fetch will follow from *this.
+		# Functors further away than this will not be searched.
+		this.fetch.depth = 256
+
+		# Settings for adaptive Fetch ordering; see feature.fetch.adapt and AdaptFetchPlan().
+		this.fetch.adapt = util.DotDict()
+
+		# Locations may only be reordered within their group.
+		# Locations which are not in any group are never moved.
+		this.fetch.adapt.groups = [
+			['config', 'precursor', 'executor', 'globals', 'environment'],
+		]
+
+		# In guarantee mode, a location is only moved ahead of the others in its group if it is where the varName was found since the last change (see FetchCache).
+		# Every location before it must have missed, so the result of Fetch never changes.
+		# Otherwise, the locations in each group are simply ordered by how often they answered.
+		this.fetch.adapt.guarantee = True
+
+		# How many Fetches of each varName (per Functor) to learn from before reordering.
+		this.fetch.adapt.probes = 10
+
+		# Fetch plans bind the ordered location names from CompileFetchPlan() to the callables in fetch.locations.
+		# They are rebuilt whenever PopulateFetchLocations() is called.
+		# See GetFetchPlan() for details.
+		this.cache.fetch = util.DotDict()
+		this.cache.fetch.plans = {}
+
+		# Results of previous Fetches, in the form of {(varName, plan key): (generation, found, value, location)}.
+		# Only used when feature.fetch.cache is enabled. See FetchUsingPlan() for details.
+		this.cache.fetch.results = util.Cache()
+
+		# Scopes of previous Fetches, in the form of {(varName, plan key, fetch.depth): scope}.
+		# See SearchFetchScopes() for details.
+		this.cache.fetch.scopes = util.Cache()
+
+		# Where each varName was found by *this, in the form of {(varName, plan key): DotDict}.
+		# Only recorded when feature.fetch.adapt is enabled; see AdaptFetchPlan().
+		this.cache.fetch.stats = util.Cache()
+
+		# Views of dicts from EvaluateToType(), in the form of {(id(source), evaluateExpressions): (source, view)}.
+		# Views are only kept for the FetchCache generation in viewsGeneration.
+		# Only used when feature.lazyDicts is enabled. See GetDictView() for details.
+		this.cache.views = util.Cache()
+		this.cache.viewsGeneration = None
+
+		# Results of __getattr__ Fetches (see FetchAttr()), in the form of {attribute: (FetchCache.GetVersion(attribute), (value, found))}.
+		# Only used when feature.fetch.attrCache is enabled.
+		this.cache.attr = util.Cache()
+
+		# Coercers for each arg in arg.type, in the form of {varName: (arg.type[varName], coercer)}.
+		# See GetArgCoercer() for details.
+		this.cache.coercers = {}
+
+		# The last Functor made for each Functor-typed arg, in the form of {varName: (value, Functor)}.
+		this.cache.coerced = util.Cache()
+
+		# The fingerprint of the call *this was last warmed for. Only used when feature.stayWarm is enabled.
+		# None if *this was last warmed some other way (e.g. by calling WarmUp() directly), in which case a warm *this is simply called.
+		# See GetCallFingerprint() for details.
+		this.cache.warm = None
+
+		# Methods bound to *this or to the precursors of *this, in the form of {(id(definition), id(epidef), occurrence): (definition, epidef, Method)}.
+		# See GetBinding() for details.
+		this.cache.methods = util.Cache()
+
+		# How many times each definition has been bound to each epidef while populating this.methods, in the form of {(id(definition), id(epidef)): count}.
+		this.cache.occurrences = {}
+
+		# The id of the method table *this has populated; None if it could not be identified.
+		# See GetMethodTableKey() for details.
+		this.cache.methodTable = None
+
 		# System executables that *this depends on.
 		this.program = util.DotDict()
 
@@ -199,10 +341,42 @@ class Functor(Datum, BackwardsCompatible):
 		# You'd want to enable this if you plan to make significant modifications to the object provided to PrepareNext(...).
 		this.feature.sequence.clone = False
 
+		# Detect when *this is called in an expression using / (e.g. first() / second()) and start a sequence for it (see WillPerformSequence()).
+		# Detection looks at the bytecode of the caller, and any / in the caller counts (e.g. numeric division), so it is off by default.
+		# eons.sequence() builds sequences without detection.
+		this.feature.sequence.detect = False
+
 		# If *this stays warm, it will not need to WarmUp() before each call.
 		# This essentially results in caching the args and state of *this, and transfers the responsibility of calling WarmUp to the greater system.
 		this.feature.stayWarm = False
 
+		# Store lists of only ints or only floats from EvaluateToType() (e.g. those in a config) as compact buffers.
+		# May be False, 'array' (python's array module), or 'numpy' (if installed).
+		this.feature.numericBuffers = False
+
+		# Have EvaluateToType() return read-only views of dicts (see util.DotDictView), which convert values only as they are accessed.
+		# Views are remembered per source dict, so the same config subtree is only ever wrapped once by *this.
+		# Dicts from Set() will not be mutable when this is enabled; copy() them first.
+		this.feature.lazyDicts = False
+
+		this.feature.fetch = util.DotDict()
+
+		# Remember what Fetch returned until something changes (see FetchCache).
+		# Changes are tracked through Set, WarmUp, Executor.SetGlobal, etc. If you assign values directly (e.g. this.value = ...) or change the environment, call InvalidateFetchCache().
+		this.feature.fetch.cache = False
+
+		# Remember what __getattr__ Fetched (see FetchAttr()), including misses, until the attribute changes.
+		# Changes are tracked per attribute through Set, WarmUp, Executor.SetGlobal, etc.; everything is dropped whenever *this is called.
+		# Values assigned directly to the Functors *this Fetches attributes from (e.g. this.precursor.value = ...) are not tracked, so only enable this if you use Set() (or call InvalidateFetchCache() after assigning).
+		this.feature.fetch.attrCache = False
+
+		# Allow nested config values to be Fetched by their dotted path (e.g. Fetch('service.mysql.port')).
+		# Top level keys are always checked first, so a key which itself contains a '.' will still be found.
+		this.feature.fetch.dotted = False
+
+		# Let the order of fetch.use adapt to where each varName is actually found (see fetch.adapt).
+		this.feature.fetch.adapt = False
+
 		# Allow partial function calls by marking *this as incomplete.
 		# Incomplete means that more arguments need to be provided.
 		this.incomplete = False
@@ -393,6 +567,23 @@ class Functor(Datum, BackwardsCompatible):
 				except:
 					logging.warning(f"Unable to update the dict of {this.name} ({type(this)}).")
 
+		# Cached Fetch plans & results belong to other; start fresh.
+		this.cache = util.DotDict(this.cache)
+		this.cache.fetch = util.DotDict()
+		this.cache.fetch.plans = {}
+		this.cache.fetch.results = util.Cache()
+		this.cache.fetch.scopes = util.Cache()
+		this.cache.fetch.stats = util.Cache()
+		this.cache.views = util.Cache()
+		this.cache.viewsGeneration = None
+		this.cache.attr = util.Cache()
+		this.cache.coercers = {}
+		this.cache.coerced = util.Cache()
+		this.cache.warm = None
+		this.cache.methods = util.Cache()
+		this.cache.methodTable = None
+		FetchCache.Invalidate()
+
 
 	# Make everything in the solute available in the solvent.
 	# Will modify the solvent (i.e. non-const) but not the solute (i.e. const).
@@ -435,91 +626,342 @@ class Functor(Datum, BackwardsCompatible):
 
 	# Create a list of methods / member functions which will search different places for a variable.
 	# See the end of the file for examples of these methods.
+	# Any compiled Fetch plans are dropped, since they may refer to the previous locations.
 	def PopulateFetchLocations(this):
+		this.cache.fetch.plans = {}
+		this.cache.fetch.scopes = util.Cache()
+		locations = this.fetch.locations
+		for loc, function in Functor.GetFetchLocationFunctions(type(this), tuple(this.fetch.possibilities)):
+			locations[loc] = function.__get__(this)
+
+
+	# Find the fetch_location_{loc}() function of cls for each of the given possibilities.
+	# If the user didn't define fetch_location_{loc}(), that's okay. No need to complain; the rest of the possibilities are skipped.
+	# RETURNS: a tuple of (loc, function) pairs, which only depends on the class, so is only computed once.
+	@staticmethod
+	@functools.lru_cache(maxsize=1024)
+	def GetFetchLocationFunctions(cls, possibilities):
+		ret = []
+		for loc in possibilities:
+			function = inspect.getattr_static(cls, f"fetch_location_{loc}", None)
+			if (function is None):
+				break
+			ret.append((loc, function))
+		return tuple(ret)
+
+
+	# Determine the order in which Fetch locations should be searched.
+	# Locations in exclude are removed from current; locations in include are then added (i.e. include wins).
+	# Included locations are inserted after the nearest location that precedes them in fetch.possibilities, so that the order of current is always preserved.
+	# RETURNS: a tuple of location names.
+	def CompileFetchPlan(this, current, include=(), exclude=()):
+		key = (this.__class__, tuple(this.fetch.possibilities), tuple(current), tuple(include), tuple(exclude))
+		if (key in Functor.fetchPlans):
+			return Functor.fetchPlans[key]
+
+		plan = [loc for loc in dict.fromkeys(current) if loc not in exclude]
+		for loc in include:
+			if (loc in plan):
+				continue
+			if (loc not in this.fetch.possibilities):
+				plan.append(loc)
+				continue
+			position = 0
+			for preceding in reversed(this.fetch.possibilities[:this.fetch.possibilities.index(loc)]):
+				if (preceding in plan):
+					position = plan.index(preceding) + 1
+					break
+			plan.insert(position, loc)
+
+		Functor.fetchPlans[key] = tuple(plan)
+		return Functor.fetchPlans[key]
+
+
+	# Get the compiled Fetch plan for the given locations.
+	# A plan is a DotDict with:
+	#	use: the ordered location names, as would be given to Fetch (fetchFrom).
+	#	locations: an ordered tuple of (name, callable) pairs for the locations *this can search itself.
+	#	hops: the {name: hop} pairs for those locations which should be walked rather than called (see fetch.hops).
+	#	own: whether 'this' should be searched by WalkFetchScope() rather than called (i.e. fetch_location_this() has not been overridden).
+	#	many: the {name: callable} pairs for those locations which can search for many variables at once (see GetFetchManyLocation()).
+	# Plans are cached per distinct combination of arguments until PopulateFetchLocations() is called again.
+	def GetFetchPlan(this, current, include=(), exclude=()):
+		key = (tuple(current), tuple(include), tuple(exclude))
 		try:
-			for loc in this.fetch.possibilities:
-				this.fetch.locations.update({loc:getattr(this,f"fetch_location_{loc}")})
-		except:
-			# If the user didn't define fetch_location_{loc}(), that's okay. No need to complain
+			return this.cache.fetch.plans[key]
+		except KeyError:
 			pass
 
+		plan = util.DotDict()
+		plan.key = key
+		plan.use = this.CompileFetchPlan(*key)
+		plan.locations = tuple([(loc, this.fetch.locations[loc]) for loc in plan.use if loc in this.fetch.locations])
+		plan.hops = {}
+		plan.own = False
+		for loc, location in plan.locations:
+			if (loc in this.fetch.hops and getattr(location, '__func__', None) is getattr(Functor, f"fetch_location_{loc}", None)):
+				plan.hops[loc] = this.fetch.hops[loc]
+			elif (loc == 'this' and getattr(location, '__func__', None) is Functor.fetch_location_this):
+				plan.own = True
+		plan.many = {}
+		for loc, location in plan.locations:
+			many = this.GetFetchManyLocation(loc, location)
+			if (many is not None):
+				plan.many[loc] = many
+		this.cache.fetch.plans[key] = plan
+		return plan
+
+
+	# Locations may define a fetch_many_location_{loc}(this, varNames, defaults, fetchFrom, attempted) alongside fetch_location_{loc}, which returns a {varName: value} dict of everything found.
+	# This is only used if it is defined by the same class as the location itself; i.e. overriding fetch_location_{loc} will disable the inherited fetch_many_location_{loc}.
+	# RETURNS: the bound fetch_many_location_{loc} for the given location or None.
+	def GetFetchManyLocation(this, loc, location):
+		function = getattr(location, '__func__', None)
+		if (function is None or getattr(location, '__self__', None) is not this):
+			return None
+		for cls in type(this).__mro__:
+			if (cls.__dict__.get(f"fetch_location_{loc}") is not function):
+				continue
+			many = cls.__dict__.get(f"fetch_many_location_{loc}")
+			if (many is None):
+				return None
+			return many.__get__(this, type(this))
+		return None
+
 
 	# Convert Fetched values to their proper type.
 	# This can also allow for use of {this.val} expression evaluation.
 	# If evaluateExpressions is True, this will automatically evaluate any strings containing {} expressions.
+	# Dicts (which become DotDicts) and lists are converted iteratively, so large or deeply nested configs are fine.
+	# Lists which are already typed are copied whole; see also feature.numericBuffers.
 	def EvaluateToType(this, value, evaluateExpressions=True):
-		if (value is None or value == "None"):
-			return None
-
-		if (isinstance(value, (bool, int, float))):
-			return value
-
 		if (isinstance(value, dict)):
+			# Views are already evaluated (as they are accessed).
+			if (isinstance(value, util.DotDictView)):
+				return value
+			if (this.feature.lazyDicts):
+				return this.GetDictView(value, evaluateExpressions)
 			ret = util.DotDict()
-			for key, val in value.items():
-				ret[key] = this.EvaluateToType(val, evaluateExpressions)
-			return ret
-
-		if (isinstance(value, list)):
+		elif (isinstance(value, list)):
 			ret = []
-			for val in value:
-				ret.append(this.EvaluateToType(val, evaluateExpressions))
-			return ret
+		else:
+			return this.EvaluateValueToType(value, evaluateExpressions)
+
+		typed = Functor.typedValueTypes
+		evaluate = this.EvaluateValueToType
+		buffers = []
+		stack = [(value, ret)]
+		while (stack):
+			source, target = stack.pop()
+
+			if (isinstance(source, list)):
+				valueTypes = set(map(type, source))
+
+				# Nothing to convert; copy the whole list at once.
+				if (valueTypes <= typed):
+					target.extend(source)
+					buffers.append(target)
+					continue
 
-		if (isinstance(value, str)):
-			# Automatically determine if the string is an expression.
-			# If it is, evaluate it.
-			if (evaluateExpressions and ('{' in value and '}' in value)):
-				evaluatedValue = eval(f"f\"{value}\"")
-			else:
-				evaluatedValue = value
+				if (not any([issubclass(valueType, (dict, list)) for valueType in valueTypes])):
+					target.extend([evaluate(val, evaluateExpressions) for val in source])
+					buffers.append(target)
+					continue
 
-			# Check resulting type and return a casted value.
-			# TODO: is there a better way than double cast + comparison?
-			if (evaluatedValue.lower() == "false"):
-				return False
-			elif (evaluatedValue.lower() == "true"):
-				return True
+				for val in source:
+					if (isinstance(val, dict)):
+						child = util.DotDict()
+						stack.append((val, child))
+						val = child
+					elif (isinstance(val, list)):
+						child = []
+						stack.append((val, child))
+						val = child
+					elif (type(val) not in typed):
+						val = evaluate(val, evaluateExpressions)
+					target.append(val)
+				continue
 
-			try:
-				if (str(float(evaluatedValue)) == evaluatedValue):
-					return float(evaluatedValue)
-			except:
-				pass
+			for key, val in source.items():
+				valueType = type(val)
+				if (valueType in typed):
+					pass
+				elif (valueType is str):
+					val = evaluate(val, evaluateExpressions)
+				elif (isinstance(val, dict)):
+					child = util.DotDict()
+					stack.append((val, child))
+					val = child
+				elif (isinstance(val, list)):
+					child = []
+					stack.append((val, child))
+					val = child
+				else:
+					val = evaluate(val, evaluateExpressions)
+				target[key] = val
 
-			try:
-				if (str(int(evaluatedValue)) == evaluatedValue):
-					return int(evaluatedValue)
-			except:
-				pass
+		if (this.feature.numericBuffers):
+			return this.BufferNumericLists(ret, buffers)
+		return ret
+
+
+	# Wrap the given dict in a util.DotDictView, which will EvaluateToType() each value as it is accessed.
+	# The same view is returned each time the same dict is given, so repeated Fetches of a config subtree do not repeat any work.
+	# Views are dropped whenever something changes (e.g. a Set(); see FetchCache), so the cache only ever holds the dicts used since then.
+	# Changing a dict in place is not tracked; call InvalidateFetchCache() if you do.
+	# RETURNS: a read-only view of value.
+	def GetDictView(this, value, evaluateExpressions=True):
+		generation = FetchCache.GetGeneration()
+		if (this.cache.viewsGeneration != generation):
+			this.cache.views = util.Cache()
+			this.cache.viewsGeneration = generation
+
+		key = (id(value), evaluateExpressions)
+		cached = this.cache.views.get(key)
+		# Holding the source in the cache keeps its id from being reused.
+		if (cached is not None and cached[0] is value):
+			return cached[1]
+
+		view = util.DotDictView(value, lambda val: this.EvaluateToType(val, evaluateExpressions))
+		this.cache.views[key] = (value, view)
+		return view
+
+
+	# Convert a single (non-container) value to its proper type.
+	# See EvaluateToType() for details.
+	def EvaluateValueToType(this, value, evaluateExpressions=True):
+		if (value is None):
+			return None
+
+		if (not isinstance(value, str)):
+			# bool, int, float, or... Meh. Who knows?
+			return value
+
+		if (value == "None"):
+			return None
 
+		# Automatically determine if the string is an expression.
+		# If it is, evaluate it.
+		evaluatedValue = value
+		if (evaluateExpressions and ('{' in value and '}' in value)):
+			template = Functor.CompileTemplate(value)
+			if (template is not None):
+				evaluatedValue = eval(template)
+
+		# Check resulting type and return a casted value.
+		match = Functor.typePattern.match(evaluatedValue)
+		if (match is None):
 			# The type must be a plain-old string.
 			return evaluatedValue
 
-		# Meh. Who knows?
+		if (match.lastgroup == 'bool'):
+			return evaluatedValue.lower() == "true"
+
+		try:
+			if (match.lastgroup == 'int'):
+				return int(evaluatedValue)
+			if (str(float(evaluatedValue)) == evaluatedValue):
+				return float(evaluatedValue)
+		except ValueError:
+			# e.g. more digits than python will convert.
+			pass
+		return evaluatedValue
+
+
+	# Replace the given lists (which must be somewhere within value) with compact buffers, if they hold only ints or only floats.
+	# feature.numericBuffers may be 'array' (python's array module) or 'numpy' (which falls back to 'array' if numpy is not installed).
+	# RETURNS: value, or its buffer if value itself is one of the lists.
+	def BufferNumericLists(this, value, lists):
+		toBuffer = {}
+		for lst in lists:
+			if (not lst):
+				continue
+			valueTypes = set(map(type, lst))
+			if (valueTypes == {int} or valueTypes == {float}):
+				toBuffer[id(lst)] = this.BufferNumericList(lst, valueTypes.pop())
+
+		if (not toBuffer):
+			return value
+		if (id(value) in toBuffer):
+			return toBuffer[id(value)]
+
+		stack = [value]
+		while (stack):
+			container = stack.pop()
+			items = container.items() if isinstance(container, dict) else enumerate(container)
+			for key, val in items:
+				if (isinstance(val, list)):
+					if (id(val) in toBuffer):
+						container[key] = toBuffer[id(val)]
+					else:
+						stack.append(val)
+				elif (isinstance(val, dict)):
+					stack.append(val)
 		return value
 
 
+	# RETURNS: the given list of ints or floats as a buffer, per feature.numericBuffers, or the list itself if it can't be buffered.
+	def BufferNumericList(this, lst, valueType):
+		if (this.feature.numericBuffers == 'numpy'):
+			try:
+				import numpy
+				return numpy.array(lst, dtype=numpy.int64 if valueType is int else numpy.float64)
+			except ImportError:
+				logging.debug("numpy is not installed; using array instead.")
+			except OverflowError:
+				return lst
+
+		try:
+			return array.array('q' if valueType is int else 'd', lst)
+		except OverflowError:
+			return lst
+
+
+	# Compile a string containing {expressions} as an f-string, to be eval'd by EvaluateToType().
+	# The same strings tend to be evaluated over and over (e.g. config values on every WarmUp), so the most recent templates are kept.
+	# RETURNS: the compiled template or None, if value has no valid expression in it (e.g. "{}" or '{"not": "an expression"}').
+	@staticmethod
+	@functools.lru_cache(maxsize=1024)
+	def CompileTemplate(value):
+		# Cheap check first: strings with only empty {} fields can never be valid f-strings.
+		try:
+			fields = [field for literal, field, spec, conversion in string.Formatter().parse(value) if field is not None]
+			if (fields and not any([field.strip() for field in fields])):
+				return None
+		except ValueError:
+			pass
+
+		try:
+			return compile(f"f\"{value}\"", '<template>', 'eval')
+		except SyntaxError as e:
+			logging.debug(f"Not evaluating {value}: {e}")
+			return None
+
+
 	# Wrapper around setattr
 	def Set(this, varName, value, evaluateExpressions=True):
-		for key, var in this.override.config.items():
-			if (varName == key):
-				varName = var
-				break
-		if (varName in this.arg.type.keys()):
-			cls = this.arg.type[varName]
-			if (not inspect.isclass(cls) and isinstance(cls, object)):
-				cls = cls.__class__
-			if (issubclass(cls, Functor)):
-				value = cls(value=value)
-				value.Set('epidef', this)
-			else:
-				value = cls(value)
+		varName = this.override.config.get(varName, varName)
+		argType = this.arg.type.get(varName)
+		if (argType is not None):
+			value = this.GetArgCoercer(varName, argType)(this, varName, value)
 		else:
 			value = this.EvaluateToType(value, evaluateExpressions)
 
-		logging.info(f"[{this.name}] {varName} = {value} ({type(value)})")
-		exec(f"this.{varName} = value")
+		# Only actual changes need to invalidate cached Fetch results.
+		try:
+			previous = this.__dict__[varName]
+			changed = previous is not value and (type(previous) is not type(value) or previous != value)
+		except:
+			changed = True
+		if (changed):
+			root = varName.split('.', 1)[0]
+			if (root in Functor.fetchStructure or root in this.fetch.possibilities):
+				FetchCache.Invalidate()
+			else:
+				FetchCache.Invalidate(varName)
+
+		Trace.Event(this, logging.INFO, 'set', "[{name}] {varName} = {value} ({valueType})", varName=varName, value=value, valueType=type(value))
+		util.SetAttr(this, varName, value)
 
 
 	# Will try to get a value for the given varName from:
@@ -531,12 +973,32 @@ class Functor(Datum, BackwardsCompatible):
 	#   When not starting (i.e. when called from another Fetch() call): a tuple containing either the value of the given variable or default and a boolean indicating if the given value is the default or if the Fetch was successful.
 	# The attempted argument will keep track of where we've looked so that we don't enter any cycles. Attempted implies not start.
 	def Fetch(this, varName, default=None, fetchFrom=None, start=True, attempted=None):
+		if (fetchFrom is None):
+			fetchFrom = this.fetch.use
+		return this.FetchUsingPlan(this.GetFetchPlan(fetchFrom), varName, default, start, attempted)
+
+
+	# Fetch, given a plan from GetFetchPlan().
+	# See Fetch() for details.
+	# If feature.fetch.cache is enabled, the results of Fetches started by *this are remembered for the current FetchCache generation.
+	def FetchUsingPlan(this, plan, varName, default=None, start=True, attempted=None):
+		cacheKey = None
+		profileStart = None
+		adaptedFrom = None
 		if (attempted is None):
 			attempted = []
+			if (this.feature.fetch.adapt):
+				adaptedFrom = plan
+				plan = this.AdaptFetchPlan(plan, varName)
+			if (this.feature.fetch.cache):
+				cacheKey = (varName, plan.key)
+			# Only profile the outermost Fetch, not those made by __getattr__ along the way (see FetchAttr()).
+			if (FetchProfiler.enabled and Functor.GetAttrFetches() is None):
+				profileStart = time.perf_counter()
 
 		# This can happen if *this is both the epidef and the caller, etc.
 		if (this in attempted):
-			logging.debug(f"...{this} already tried to fetch {varName} (attempted: {attempted}); returning default: {default}.")
+			Trace.Event(this, logging.DEBUG, 'fetch.cycle', "...{name} already tried to fetch {varName} (attempted: {attempted}); returning default: {default}.", varName=varName, attempted=attempted, default=default)
 			if (start):
 				return default
 			else:
@@ -544,58 +1006,452 @@ class Functor(Datum, BackwardsCompatible):
 
 		attempted.append(this)
 
-		if (fetchFrom is None):
-			fetchFrom = this.fetch.use
-
 		if (start):
-			logging.debug(f"Fetching {varName} from {fetchFrom}...")
+			Trace.Event(this, logging.DEBUG, 'fetch.start', "Fetching {varName} from {use}...", varName=varName, use=plan.use)
+
+		cached = None
+		if (cacheKey is not None):
+			generation = FetchCache.GetGeneration()
+			cached = this.cache.fetch.results.get(cacheKey)
+			if (cached is not None and cached[0] != generation):
+				cached = None
+
+		if (cached is not None):
+			found, ret, loc = cached[1:]
+			Trace.Event(this, logging.DEBUG, 'fetch.cached', "...{name} got {varName} from cache ({location}).", varName=varName, location=loc)
+		else:
+			found, ret, loc = this.SearchFetchLocations(plan, varName, default, attempted)
+			if (cacheKey is not None):
+				this.cache.fetch.results[cacheKey] = (generation, found, ret, loc)
 
-		for loc in fetchFrom:
-			if (loc not in this.fetch.locations.keys()):
-				# Maybe the location is meant for executor, precursor, etc.
-				continue
+		if (profileStart is not None):
+			this.ProfileFetch(plan, varName, loc, time.perf_counter() - profileStart)
 
-			logging.debug(f"...{this.name} fetching {varName} from {loc}...")
-			ret, found = this.fetch.locations[loc](varName, default, fetchFrom, attempted)
-			if (found):
-				logging.debug(f"...{this.name} got {varName} from {loc}: {ret} ({type(ret)}).")
-				if (this.callback.fetch):
-					this.callback.fetch(varName = varName, location = loc, value = ret)
-				if (start):
-					return ret
-				return ret, True
+		if (adaptedFrom is not None):
+			this.LearnFetch(adaptedFrom, varName, loc)
+
+		if (found):
+			Trace.Event(this, logging.DEBUG, 'fetch.found', "...{name} got {varName} from {location}: {value} ({valueType}).", varName=varName, location=loc, value=ret, valueType=type(ret))
+			if (this.callback.fetch):
+				this.callback.fetch(varName = varName, location = loc, value = ret)
+			if (start):
+				return ret
+			return ret, True
 
 		if (this.callback.fetch):
 			this.callback.fetch(varName = varName, location = 'default', value = default)
 
 		if (start):
-			logging.debug(f"...{this.name} could not find {varName}; using default: {default}.")
+			Trace.Event(this, logging.DEBUG, 'fetch.default', "...{name} could not find {varName}; using default: {default}.", varName=varName, default=default)
 			return default
 		else:
 			return default, False
 
 
+	# Reorder the given plan for varName, based on where *this has found varName before.
+	# Only locations in the same fetch.adapt.groups are reordered, and only after fetch.adapt.probes Fetches of varName have been learned from (see LearnFetch()).
+	# RETURNS: the plan to use instead of the given plan (which may be the same plan).
+	def AdaptFetchPlan(this, plan, varName):
+		stats = this.cache.fetch.stats.get((varName, plan.key))
+		if (stats is None or stats.fetches < this.fetch.adapt.probes):
+			return plan
+
+		# What was learned in guarantee mode only holds until something changes.
+		if (this.fetch.adapt.guarantee and stats.generation != FetchCache.GetGeneration()):
+			return plan
+
+		# In guarantee mode, the order won't change once probing is done.
+		# Otherwise, the order is reconsidered every fetch.adapt.probes Fetches.
+		key = (plan.key, None if this.fetch.adapt.guarantee else stats.fetches // this.fetch.adapt.probes)
+		try:
+			return this.GetFetchPlan(stats.orders[key])
+		except KeyError:
+			pass
+
+		use = list(plan.use)
+		for group in this.fetch.adapt.groups:
+			positions = [position for position, loc in enumerate(use) if loc in group]
+			members = [use[position] for position in positions]
+			if (this.fetch.adapt.guarantee):
+				present = [loc for loc in members if loc in stats.present]
+				if (len(present) != 1):
+					continue
+				members.remove(present[0])
+				members.insert(0, present[0])
+			else:
+				members.sort(key=lambda loc: -stats.hits.get(loc, 0))
+			for position, loc in zip(positions, members):
+				use[position] = loc
+
+		if (use != list(plan.use)):
+			Trace.Event(this, logging.DEBUG, 'fetch.adapt', "{name} will fetch {varName} from {use} instead of {original}.", varName=varName, use=use, original=plan.use)
+
+		# Only keep the latest order for each plan.
+		stats.orders = {k: v for k, v in stats.orders.items() if k[0] != plan.key}
+		stats.orders[key] = use
+		return this.GetFetchPlan(use)
+
+
+	# Learn where varName was found (loc; None if it wasn't) by a Fetch using the given (unadapted) plan.
+	# Since Fetch stops at the first location with varName, every location before loc did not have it.
+	# In guarantee mode, everything learned is forgotten when the FetchCache generation changes, since any location may have changed.
+	def LearnFetch(this, plan, varName, loc):
+		key = (varName, plan.key)
+		generation = FetchCache.GetGeneration()
+		stats = this.cache.fetch.stats.get(key)
+		if (stats is None or (this.fetch.adapt.guarantee and stats.generation != generation)):
+			stats = util.DotDict({'generation': generation, 'fetches': 0, 'hits': {}, 'present': set(), 'orders': {}})
+			this.cache.fetch.stats[key] = stats
+
+		stats.fetches += 1
+		if (loc is not None):
+			stats.hits[loc] = stats.hits.get(loc, 0) + 1
+			stats.present.add(loc)
+
+
+	# Record a Fetch with the FetchProfiler.
+	# loc should be where varName was found (or None, if the default was used).
+	def ProfileFetch(this, plan, varName, loc, elapsed):
+		searched = [name for name, location in plan.locations]
+		if (loc is None):
+			tried = len(searched)
+		else:
+			tried = searched.index(loc)
+		FetchProfiler.Record(this, varName, loc, tried, elapsed)
+
+
+	# Search each location in the given plan, in order, walking any hops to other Functors.
+	# RETURNS: a tuple of whether or not varName was found, the value found (or default), and the location of *this it was found through (or None).
+	def SearchFetchLocations(this, plan, varName, default, attempted):
+		if (Functor.GetAttrFetches() is not None):
+			return this.SearchFetchScopes(plan, varName, default, attempted)
+
+		Functor.fetchState.attrFetches = {}
+		try:
+			return this.SearchFetchScopes(plan, varName, default, attempted)
+		finally:
+			Functor.fetchState.attrFetches = None
+
+
+	# Search the cached scope of varName or walk a new one.
+	# See SearchFetchLocations() for details.
+	def SearchFetchScopes(this, plan, varName, default, attempted):
+		# Scopes depend on what has already been attempted, so only fresh searches may be cached.
+		scopeKey = None
+		if (not attempted[1:]):
+			scopeKey = (varName, plan.key, this.fetch.depth)
+			scope = this.cache.fetch.scopes.get(scopeKey)
+			if (scope is not None):
+				# Custom locations may still Fetch from other Functors; don't let them search what we're about to.
+				attempted.extend(scope.nodes[1:])
+				result = this.SearchFetchScope(scope, scope.steps, varName, default, attempted)
+				if (result is not None):
+					return result
+				del attempted[1:]
+
+		scope = util.DotDict()
+		scope.steps = []
+		scope.nodes = [this]
+		scope.complete = False
+		if (scopeKey is not None):
+			this.cache.fetch.scopes[scopeKey] = scope
+		return this.SearchFetchScope(scope, this.WalkFetchScope(scope, plan, varName, attempted), varName, default, attempted)
+
+
+	# Walk the scope of a Fetch for varName, recording each step in the given scope.
+	# The Functors reachable through fetch.hops are walked iteratively and depth first, which is the same order they would be searched in if each hop were to Fetch from the next Functor.
+	# Searching 'this' of a Functor only reads its own attributes (see FetchOwnAttribute()); rather than letting __getattr__ Fetch the rest from fetch.attr.use, which would walk the rest of the scope again, the hops in fetch.attr.use are walked from there instead.
+	# Each Functor is only searched once per plan (e.g. once through fetch.attr.use and once through fetch.use) and hops beyond fetch.depth are not followed.
+	# Functors are identified by id(), so this is linear in the number of Functors reached, regardless of how they are chained together.
+	# Steps are (node, loc, location, many, fetchFrom, target, plans, path) tuples, where:
+	#	for locations which should be called: location is the callable, many is the fetch_many_location_{loc} (or None) and fetchFrom is the node's plan.use.
+	#	for hops: location is None, target is the Functor hopped to (or None) and plans is target.cache.fetch.plans (used to check if the step is still valid).
+	#	path is how node was reached from *this, as nested (path, Functor, hop) tuples (or None for *this).
+	# The Functors searched are added to scope.nodes (and attempted) and scope.complete is set once the walk is done.
+	# RETURNS: a generator of steps.
+	def WalkFetchScope(this, scope, plan, varName, attempted):
+		reached = {id(node) for node in attempted}
+		excluded = set(reached)
+		visited = set()
+		tracing = Trace.Enabled(this, logging.DEBUG)
+
+		stack = [(this, plan, iter(plan.locations), None, 0)]
+		while (stack):
+			node, nodePlan, locations, path, depth = stack[-1]
+			for loc, location in locations:
+				hop = nodePlan.hops.get(loc)
+				if (hop is None):
+					if (loc == 'this' and nodePlan.own):
+						step = (node, loc, node.FetchOwnAttribute, None, nodePlan.use, None, None, path)
+						scope.steps.append(step)
+						yield step
+						attrPlan = node.GetFetchPlan(node.fetch.attr.use, exclude=['this'])
+						if (attrPlan.locations):
+							stack.append((node, attrPlan, iter(attrPlan.locations), path, depth))
+							break
+						continue
+
+					step = (node, loc, location, nodePlan.many.get(loc), nodePlan.use, None, None, path)
+					scope.steps.append(step)
+					yield step
+					continue
+
+				target = node.GetFetchHop(loc, varName)
+				scope.steps.append((node, loc, None, None, None, target, target.cache.fetch.plans if target is not None else None, path))
+				if (target is None or id(target) in excluded):
+					continue
+				targetPlan = target.GetFetchPlan(nodePlan.use, hop.include, hop.exclude)
+				if ((id(target), targetPlan.key) in visited):
+					continue
+				if (depth >= this.fetch.depth):
+					Trace.Event(this, logging.WARNING, 'fetch.depth', "{name} will not fetch {varName} from {location} of {node}: maximum depth ({depth}) reached.", varName=varName, location=loc, node=node.name, depth=depth)
+					continue
+
+				visited.add((id(target), targetPlan.key))
+				if (id(target) not in reached):
+					reached.add(id(target))
+					scope.nodes.append(target)
+					attempted.append(target)
+				if (tracing):
+					Trace.Event(this, logging.DEBUG, 'fetch.hop', "...{name} will fetch {varName} from {target} ({location} of {node}).", varName=varName, target=target.name, location=loc, node=node.name)
+				stack.append((target, targetPlan, iter(targetPlan.locations), (path, node, loc), depth + 1))
+				break
+			else:
+				stack.pop()
+
+		scope.complete = True
+
+
+	# Search the given steps (see WalkFetchScope()).
+	# RETURNS: the same as SearchFetchLocations() or None, if the steps of a cached scope are no longer valid (i.e. a hop has changed) or incomplete.
+	def SearchFetchScope(this, scope, steps, varName, default, attempted):
+		tracing = Trace.Enabled(this, logging.DEBUG)
+		for node, loc, location, many, fetchFrom, target, plans, path in steps:
+			if (location is None):
+				if (node.GetFetchHop(loc, varName) is not target or (target is not None and target.cache.fetch.plans is not plans)):
+					return None
+				continue
+
+			if (tracing):
+				Trace.Event(this, logging.DEBUG, 'fetch.location', "...{name} fetching {varName} from {location} of {node}...", varName=varName, location=loc, node=node.name)
+			ret, found = location(varName, default, fetchFrom, attempted)
+			if (not found):
+				continue
+
+			# Let everyone between *this and node know where the value came from.
+			while (path is not None):
+				if (node.callback.fetch):
+					node.callback.fetch(varName = varName, location = loc, value = ret)
+				path, node, loc = path
+			return True, ret, loc
+
+		if (not scope.complete):
+			return None
+
+		for node in scope.nodes[1:]:
+			if (node.callback.fetch):
+				node.callback.fetch(varName = varName, location = 'default', value = default)
+		return False, default, None
+
+
+	# Get the Functor which the given hop (see fetch.hops) leads to.
+	# RETURNS: the Functor to search for varName or None.
+	def GetFetchHop(this, loc, varName):
+		if (loc == 'executor'):
+			return this.GetExecutor()
+
+		# We should only fetch from the epidef implicitly.
+		# If we've explicitly defined an override, find the value elsewhere or use the default.
+		if (loc == 'epidef' and (varName in this.arg.kw.optional or varName in this.arg.kw.required)):
+			return None
+
+		return this.__dict__.get(loc)
+
+
+	# Fetch many variables at once.
+	# This is the same as calling Fetch() for each varName, except each location is only searched once for all the variables which have not yet been found.
+	# defaults should be a dict of {varName: default}; variables without a default will default to None.
+	# RETURNS:
+	#   When starting: a dict of {varName: value or default}
+	#   When not starting: a dict of {varName: (value or default, found)}
+	def FetchMany(this, varNames, defaults=None, fetchFrom=None, start=True):
+		if (fetchFrom is None):
+			fetchFrom = this.fetch.use
+		return this.FetchManyUsingPlan(this.GetFetchPlan(fetchFrom), varNames, defaults, start)
+
+
+	# FetchMany, given a plan from GetFetchPlan().
+	# See FetchMany() for details.
+	def FetchManyUsingPlan(this, plan, varNames, defaults=None, start=True):
+		if (defaults is None):
+			defaults = {}
+		varNames = list(dict.fromkeys(varNames))
+
+		Trace.Event(this, logging.DEBUG, 'fetch.start', "Fetching {varName} from {use}...", varName=varNames, use=plan.use)
+
+		results = {}
+		pending = varNames
+		if (this.feature.fetch.cache):
+			generation = FetchCache.GetGeneration()
+			pending = []
+			for varName in varNames:
+				cached = this.cache.fetch.results.get((varName, plan.key))
+				if (cached is not None and cached[0] == generation):
+					results[varName] = cached[1:]
+				else:
+					pending.append(varName)
+
+		if (pending):
+			profileStart = time.perf_counter() if (FetchProfiler.enabled and Functor.GetAttrFetches() is None) else None
+			searched = this.SearchFetchLocationsMany(plan, pending, defaults)
+			if (this.feature.fetch.cache):
+				for varName, result in searched.items():
+					this.cache.fetch.results[(varName, plan.key)] = (generation, *result)
+			results.update(searched)
+
+			# The time taken is split evenly between the variables searched for.
+			if (profileStart is not None):
+				elapsed = (time.perf_counter() - profileStart) / len(pending)
+				for varName in pending:
+					this.ProfileFetch(plan, varName, searched[varName][2], elapsed)
+
+		ret = {}
+		for varName in varNames:
+			found, value, loc = results[varName]
+			if (found):
+				Trace.Event(this, logging.DEBUG, 'fetch.found', "...{name} got {varName} from {location}: {value} ({valueType}).", varName=varName, location=loc, value=value, valueType=type(value))
+			else:
+				value = defaults.get(varName)
+				loc = 'default'
+				Trace.Event(this, logging.DEBUG, 'fetch.default', "...{name} could not find {varName}; using default: {default}.", varName=varName, default=value)
+			if (this.callback.fetch):
+				this.callback.fetch(varName = varName, location = loc, value = value)
+			if (start):
+				ret[varName] = value
+			else:
+				ret[varName] = (value, found)
+		return ret
+
+
+	# Search each location in the given plan for all the given variables.
+	# Variables with the same scope are searched together.
+	# RETURNS: a dict of {varName: (found, value or default, location)}; see SearchFetchLocations().
+	def SearchFetchLocationsMany(this, plan, varNames, defaults):
+		outermost = Functor.GetAttrFetches() is None
+		if (outermost):
+			Functor.fetchState.attrFetches = {}
+		try:
+			groups = {}
+			for varName in varNames:
+				scope = this.GetFetchScope(plan, varName)
+				groups.setdefault(scope.signature, (scope, []))[1].append(varName)
+
+			results = {}
+			for scope, group in groups.values():
+				results.update(this.SearchFetchScopeMany(scope, group, defaults))
+			return results
+		finally:
+			if (outermost):
+				Functor.fetchState.attrFetches = None
+
+
+	# Get the complete scope of a Fetch for varName, walking it if the cached scope is incomplete or no longer valid.
+	# RETURNS: a scope (see WalkFetchScope()) with a signature which is the same for all scopes that have the same steps.
+	def GetFetchScope(this, plan, varName):
+		scopeKey = (varName, plan.key, this.fetch.depth)
+		scope = this.cache.fetch.scopes.get(scopeKey)
+		if (scope is not None and scope.complete):
+			for node, loc, location, many, fetchFrom, target, plans, path in scope.steps:
+				if (location is None and (node.GetFetchHop(loc, varName) is not target or (target is not None and target.cache.fetch.plans is not plans))):
+					scope = None
+					break
+
+		if (scope is None or not scope.complete):
+			scope = util.DotDict()
+			scope.steps = []
+			scope.nodes = [this]
+			scope.complete = False
+			for step in this.WalkFetchScope(scope, plan, varName, [this]):
+				pass
+			this.cache.fetch.scopes[scopeKey] = scope
+
+		if (scope.signature is None):
+			scope.signature = tuple([(id(step[0]), step[1], id(step[5])) for step in scope.steps])
+		return scope
+
+
+	# Search the steps of the given scope for all the given variables.
+	# RETURNS: a dict of {varName: (found, value or default, location)}; see SearchFetchLocations().
+	def SearchFetchScopeMany(this, scope, varNames, defaults):
+		tracing = Trace.Enabled(this, logging.DEBUG)
+		attempted = list(scope.nodes)
+		results = {}
+		remaining = varNames
+		for node, loc, location, many, fetchFrom, target, plans, path in scope.steps:
+			if (location is None):
+				continue
+
+			if (tracing):
+				Trace.Event(this, logging.DEBUG, 'fetch.location', "...{name} fetching {varName} from {location} of {node}...", varName=remaining, location=loc, node=node.name)
+			if (many is not None):
+				found = many(remaining, defaults, fetchFrom, attempted)
+			else:
+				found = {}
+				for varName in remaining:
+					ret, wasFound = location(varName, defaults.get(varName), fetchFrom, attempted)
+					if (wasFound):
+						found[varName] = ret
+			if (not found):
+				continue
+
+			for varName, ret in found.items():
+				# Let everyone between *this and node know where the value came from.
+				hopPath, hopNode, hopLoc = path, node, loc
+				while (hopPath is not None):
+					if (hopNode.callback.fetch):
+						hopNode.callback.fetch(varName = varName, location = hopLoc, value = ret)
+					hopPath, hopNode, hopLoc = hopPath
+				results[varName] = (True, ret, hopLoc)
+
+			remaining = [varName for varName in remaining if varName not in found]
+			if (not remaining):
+				return results
+
+		for varName in remaining:
+			for node in scope.nodes[1:]:
+				if (node.callback.fetch):
+					node.callback.fetch(varName = varName, location = 'default', value = defaults.get(varName))
+			results[varName] = (False, defaults.get(varName), None)
+		return results
+
+
+	# Drop all cached Fetch results.
+	# Since Fetch can traverse other Functors, this will also invalidate the results cached by all other Functors (see FetchCache).
+	def InvalidateFetchCache(this):
+		this.cache.fetch.results = util.Cache()
+		this.cache.fetch.scopes = util.Cache()
+		this.cache.attr = util.Cache()
+		this.cache.views = util.Cache()
+		FetchCache.Invalidate()
+
+
 	# Ease of use method for Fetching while including certain search locations.
 	def FetchWith(this, doFetchFrom, varName, default=None, currentFetchFrom=None, start=True, attempted=None):
 		if (currentFetchFrom is None):
 			currentFetchFrom = this.fetch.use
-		fetchFrom = list(set(currentFetchFrom + doFetchFrom))
-		return this.Fetch(varName, default, fetchFrom, start, attempted)
+		return this.FetchUsingPlan(this.GetFetchPlan(currentFetchFrom, include=doFetchFrom), varName, default, start, attempted)
 
 	# Ease of use method for Fetching while excluding certain search locations.
 	def FetchWithout(this, dontFetchFrom, varName, default=None, currentFetchFrom=None, start=True, attempted=None):
 		if (currentFetchFrom is None):
 			currentFetchFrom = this.fetch.use
-		fetchFrom = [f for f in currentFetchFrom if f not in dontFetchFrom]
-		return this.Fetch(varName, default, fetchFrom, start, attempted)
+		return this.FetchUsingPlan(this.GetFetchPlan(currentFetchFrom, exclude=dontFetchFrom), varName, default, start, attempted)
 
 	# Ease of use method for Fetching while including some search location and excluding others.
 	def FetchWithAndWithout(this, doFetchFrom, dontFetchFrom, varName, default=None, currentFetchFrom=None, start=True, attempted=None):
 		if (currentFetchFrom is None):
 			currentFetchFrom = this.fetch.use
-		fetchFrom = [f for f in currentFetchFrom if f not in dontFetchFrom]
-		fetchFrom = list(set(fetchFrom + doFetchFrom))
-		return this.Fetch(varName, default, fetchFrom, start, attempted)
+		return this.FetchUsingPlan(this.GetFetchPlan(currentFetchFrom, include=doFetchFrom, exclude=dontFetchFrom), varName, default, start, attempted)
 
 
 	# Make sure arguments are not duplicated.
@@ -607,7 +1463,7 @@ class Functor(Datum, BackwardsCompatible):
 			'program.required'
 		]
 		for dedup in deduplicate:
-			exec(f"this.{dedup} = list(dict.fromkeys(this.{dedup}))")
+			util.SetAttr(this, dedup, list(dict.fromkeys(util.GetAttr(this, dedup))))
 
 		for arg in this.arg.kw.required:
 			if (arg in this.arg.kw.optional.keys()):
@@ -623,26 +1479,132 @@ class Functor(Datum, BackwardsCompatible):
 		this.SupportBackwardsCompatibility()
 
 		this.PopulateFetchLocations()
+
+		# Deduplicated args, required programs, and arg coercers only depend on how *this was constructed.
+		template = this.GetTemplate()
+		this.arg.kw.required = list(template.required)
+		this.method.required = list(template.methods)
+		this.program.required = list(template.programs)
+		this.cache.coercers.update(template.coercers)
+
+		this.initialized = True
+
+
+	# Find or create the template for *this.
+	# Templates are keyed by class and by the args, arg types, methods, and programs *this requires, so Functors which change those in their constructor (e.g. based on their name) still get their own.
+	# Creating a template removes duplicate args (see RemoveDuplicateArgs()), checks that all required programs exist, and looks up the coercer for each arg type (see PopulateArgCoercers()); none of that is repeated for later Functors with the same template.
+	# RETURNS: a DotDict with the required args, methods, programs, and arg coercers for *this.
+	def GetTemplate(this):
+		try:
+			key = (
+				this.__class__,
+				tuple(this.arg.kw.required),
+				tuple(this.arg.kw.optional.keys()),
+				tuple(this.arg.type.items()),
+				tuple(this.method.required),
+				tuple(this.program.required),
+			)
+			template = Functor.templates.get(key)
+		except TypeError:
+			# Unhashable arg types can't be templated.
+			key = None
+			template = None
+		if (template is not None):
+			return template
+
 		this.RemoveDuplicateArgs()
 
 		for prog in this.program.required:
 			if (shutil.which(prog) is None):
 				raise FunctorError(f"{prog} required but not found in path.")
 
-		this.initialized = True
+		this.PopulateArgCoercers()
+
+		template = util.DotDict()
+		template.required = tuple(this.arg.kw.required)
+		template.methods = tuple(this.method.required)
+		template.programs = tuple(this.program.required)
+		template.coercers = {varName: this.cache.coercers[varName] for varName in this.arg.type.keys()}
+		if (key is not None):
+			Functor.templates[key] = template
+		return template
+
+	# Forget what has been learned about each class of Functor: templates (see GetTemplate()), method tables (see GetMethodTableKey()), and which of those were valid (see ValidateMethods()).
+	# Call this whenever classes may have changed (e.g. Executor.RegisterAllClassesInDirectory() does, since modules may be reloaded).
+	@staticmethod
+	def ClearCaches():
+		Functor.templates.clear()
+		Functor.methodTables.clear()
+		Functor.validMethodTables.clear()
+
+
+	# Look up the coercer for each arg in arg.type now, rather than on each Set().
+	def PopulateArgCoercers(this):
+		for varName, argType in this.arg.type.items():
+			this.GetArgCoercer(varName, argType)
+
+
+	# Coercers are remembered per varName, so long as arg.type[varName] does not change.
+	# RETURNS: a function(functor, varName, value) which converts value to argType.
+	def GetArgCoercer(this, varName, argType):
+		cached = this.cache.coercers.get(varName)
+		if (cached is not None and cached[0] is argType):
+			return cached[1]
+
+		# arg.type may hold instances (e.g. from SelfRegistering), rather than classes.
+		cls = argType
+		if (not inspect.isclass(cls)):
+			cls = cls.__class__
+
+		try:
+			coercer = Functor.argCoercers[cls]
+		except KeyError:
+			coercer = Functor.CompileArgCoercer(cls)
+			Functor.argCoercers[cls] = coercer
+
+		this.cache.coercers[varName] = (argType, coercer)
+		return coercer
+
+
+	# Build the function which coerces values to cls.
+	# Functor types are constructed with the value and given *this as their epidef. If the same value is Set again, the Functor made last time is reused.
+	# Other types are simply called with the value, unless the value is already of that (immutable) type.
+	# RETURNS: a function(functor, varName, value) which converts value to cls.
+	@staticmethod
+	def CompileArgCoercer(cls):
+		if (issubclass(cls, Functor)):
+			def CoerceToFunctor(functor, varName, value):
+				previous = functor.cache.coerced.get(varName)
+				if (previous is not None):
+					previousValue, previousFunctor = previous
+					if (previousValue is value or (type(previousValue) is type(value) and type(value) in Functor.immutableValueTypes and previousValue == value)):
+						return previousFunctor
+				ret = cls(value=value)
+				ret.Set('epidef', functor)
+				functor.cache.coerced[varName] = (value, ret)
+				return ret
+			return CoerceToFunctor
+
+		if (cls in Functor.immutableValueTypes):
+			def CoerceToImmutable(functor, varName, value):
+				if (type(value) is cls):
+					return value
+				return cls(value)
+			return CoerceToImmutable
+
+		return lambda functor, varName, value: cls(value)
+
 
 	# Make sure all static args are valid.
 	def ValidateStaticArgs(this):
 		if (this.arg.valid.static):
 			return
 
-		for skw in this.arg.kw.static:
-			if (util.HasAttr(this, skw)): # only in the case of children.
-				continue
-
-			fetched = this.Fetch(skw)
-			if (fetched is not None):
-				this.Set(skw, fetched)
+		static = [skw for skw in this.arg.kw.static if not util.HasAttr(this, skw)] # only in the case of children.
+		fetched = this.FetchMany(static)
+		for skw in static:
+			if (fetched[skw] is not None):
+				this.Set(skw, fetched[skw])
 				continue
 
 			# Nope. Failed.
@@ -655,22 +1617,60 @@ class Functor(Datum, BackwardsCompatible):
 	# DO NOT USE Fetch() IN THIS METHOD!
 	def PopulateMethods(this):
 
-		# In order for this to work properly, each method needs to be a distinct object; hence the need for deepcopy.
-		# In the future, we might be able to find a way to share code objects between Functors. However, for now we will allow each Functor to modify its classmethods as it pleases.
+		# Each method needs to be a distinct object, since each has its own epidef and next; however, the definitions in classMethods are shared by all instances.
+		# Rather than deepcopying every definition on every WarmUp, we bind each definition once and reuse the binding (see BindMethod()).
+
+		# Rebuild the method table from scratch, so that inherited methods are not chained onto themselves on subsequent WarmUps.
+		this.methods = {}
+		this.cache.occurrences = {}
+
+		# If another Functor has already merged the same methods, follow its table, rather than merging them again.
+		key = this.GetMethodTableKey()
+		methodTable = None
+		if (key is not None):
+			methodTable = Functor.methodTables.get(key)
+		if (methodTable is not None and methodTable.table is not None):
+			this.methods = this.BindMethodTable(methodTable.table)
+		else:
+			this.MergeMethods()
+			if (key is not None and methodTable is None):
+				methodTable = util.DotDict()
+				methodTable.id = Functor.methodTableCount
+				Functor.methodTableCount += 1
+				methodTable.table = this.GetMethodTable()
+				Functor.methodTables[key] = methodTable
+		this.cache.methodTable = methodTable.id if methodTable is not None else None
+
+		tracing = Trace.Enabled(this, logging.DEBUG)
+		for method in this.methods.values():
+			if (tracing):
+				Trace.Event(this, logging.DEBUG, 'methods.populate', "Populating method {name}.{method}({required}{optional})", method=method.name, required=', '.join(method.arg.kw.required), optional=''.join([f", {a}={v}" for a,v in method.arg.kw.optional.items()]))
+
+			# Python < 3.11
+			# setattr(this, method.name, method.__call__.__get__(this, this.__class__))
+
+			# appears to work for all python versions >= 3.8
+			# setattr(this, method.name, method.__call__.__get__(method, method.__class__))
+			
+			setattr(this, method.name, types.MethodType(method, this))
+
+
+	# Merge the methods from each of this.method.sources into this.methods.
+	def MergeMethods(this):
 
 		# We have to use util.___Attr() because some sources might have '.'s in them.
 
 		for source, honorPropagate in this.method.sources.items():
 			if (not util.HasAttr(this, source)):
-				logging.debug(f"Could not find {source}; will not pull in its methods.")
+				Trace.Event(this, logging.DEBUG, 'methods.missing', "Could not find {source}; will not pull in its methods.", source=source)
 				continue
 
 			methodSource = util.GetAttr(this, source)
 			if (not isinstance(methodSource, dict)):
-				logging.debug(f"{source} is not a dict; will not pull in its methods.")
+				Trace.Event(this, logging.DEBUG, 'methods.invalid', "{source} is not a dict; will not pull in its methods.", source=source)
 				continue
 
-			logging.debug(f"Populating methods from {source}.")
+			Trace.Event(this, logging.DEBUG, 'methods.source', "Populating methods from {source}.", source=source)
 			for method in methodSource.values():
 				if (honorPropagate and not method.propagate):
 					continue
@@ -679,32 +1679,116 @@ class Functor(Datum, BackwardsCompatible):
 					if (not existingMethod.inheritMethods):
 						continue
 
-					methodToInsert = deepcopy(method)
-					methodToInsert.epidef = this
-					methodToInsert.UpdateSource()
+					methodToInsert = this.BindMethod(method, this)
 
 					if (existingMethod.inheritedMethodsFirst):
-						logging.debug(f"Will call {method.name} from {source} to prior to this.")
+						Trace.Event(this, logging.DEBUG, 'methods.prepend', "Will call {method} from {source} to prior to this.", method=method.name, source=source)
 						methodToInsert.next.append(this.methods[method.name])
 						this.methods[method.name] = methodToInsert
 					else:
-						logging.debug(f"Appending {method.name} from {source} to this.")
+						Trace.Event(this, logging.DEBUG, 'methods.append', "Appending {method} from {source} to this.", method=method.name, source=source)
 						this.methods[method.name].next.append(methodToInsert)
 				else:
-					this.methods[method.name] = deepcopy(method)
-					this.methods[method.name].epidef = this
-					this.methods[method.name].UpdateSource()
+					this.methods[method.name] = this.BindMethod(method, this)
 
-		for method in this.methods.values():
-			logging.debug(f"Populating method {this.name}.{method.name}({', '.join([a for a in method.arg.kw.required] + [a+'='+str(v) for a,v in method.arg.kw.optional.items()])})")
 
-			# Python < 3.11
-			# setattr(this, method.name, method.__call__.__get__(this, this.__class__))
+	# Identify the methods *this would merge.
+	# Each source contributes either the class-level dict it refers to (e.g. classMethods) or the id of the method table of the Functor it belongs to (e.g. precursor.methods).
+	# RETURNS: a key for Functor.methodTables or None, if the sources of *this cannot be identified (in which case, methods are merged every time).
+	def GetMethodTableKey(this):
+		key = [this.__class__]
+		for source, honorPropagate in this.method.sources.items():
+			ownerName, _, attribute = source.rpartition('.')
+			try:
+				owner = util.GetAttr(this, ownerName) if ownerName else this
+				methodSource = getattr(owner, attribute)
+			except AttributeError:
+				key.append((source, honorPropagate, None))
+				continue
 
-			# appears to work for all python versions >= 3.8
-			# setattr(this, method.name, method.__call__.__get__(method, method.__class__))
-			
-			setattr(this, method.name, types.MethodType(method, this))
+			if (not isinstance(methodSource, dict)):
+				key.append((source, honorPropagate, None))
+			elif (isinstance(owner, Functor) and attribute == 'methods' and owner.__dict__.get('methods') is methodSource):
+				if (owner.cache.methodTable is None):
+					return None
+				key.append((source, honorPropagate, owner.cache.methodTable))
+			elif (getattr(type(owner), attribute, None) is methodSource):
+				key.append((source, honorPropagate, type(owner), id(methodSource)))
+			else:
+				return None
+		return tuple(key)
+
+
+	# RETURNS: the Functors methods may be bound to, starting with *this and followed by each precursor.
+	def GetEpidefs(this):
+		ret = [this]
+		while (True):
+			precursor = ret[-1].__dict__.get('precursor')
+			if (not isinstance(precursor, Functor) or precursor in ret):
+				return ret
+			ret.append(precursor)
+
+
+	# Describe this.methods, such that another Functor can bind the same methods without merging them (see BindMethodTable()).
+	# Each method is described by its definition, by which of GetEpidefs() it is bound to, and by the description of each of its next methods.
+	# RETURNS: the description of this.methods or None, if a method is bound to something other than *this or a precursor.
+	def GetMethodTable(this):
+		epidefs = this.GetEpidefs()
+
+		def Describe(method):
+			depth = next((depth for depth, epidef in enumerate(epidefs) if epidef is method.epidef), None)
+			if (depth is None):
+				raise ValueError(f"{method.name} is not bound to {this.name} or any of its precursors.")
+			definition = method.definition if method.definition is not None else method
+			return (definition, depth, tuple([Describe(next) for next in method.next]))
+
+		try:
+			return tuple([(name, Describe(method)) for name, method in this.methods.items()])
+		except ValueError as e:
+			Trace.Event(this, logging.DEBUG, 'methods.table', "Not caching methods: {error}", error=str(e))
+			return None
+
+
+	# Bind the methods described by table (see GetMethodTable()) to *this and its precursors.
+	# RETURNS: the method table for *this.
+	def BindMethodTable(this, table):
+		epidefs = this.GetEpidefs()
+
+		def Bind(description):
+			definition, depth, next = description
+			ret = this.GetBinding(definition, epidefs[depth])
+			ret.next = [Bind(method) for method in next]
+			return ret
+
+		return {name: Bind(description) for name, description in table}
+
+
+	# Get a Method which calls method's definition on behalf of epidef.
+	# Bindings are cached in this.cache.methods, so each definition is only copied & compiled once per epidef.
+	# The next Methods of method (e.g. those a precursor inherited) are bound to their own epidefs.
+	# RETURNS: the bound Method.
+	def BindMethod(this, method, epidef):
+		definition = method.definition if method.definition is not None else method
+		ret = this.GetBinding(definition, epidef)
+		ret.next = [this.BindMethod(next, next.epidef) for next in method.next if next is not method]
+		return ret
+
+
+	# The same definition may be bound to the same epidef more than once (e.g. when a precursor of the same class propagates its methods to *this), so each occurrence within this.methods gets its own binding.
+	# RETURNS: the Method binding definition to epidef, which is created only once.
+	def GetBinding(this, definition, epidef):
+		occurrence = (id(definition), id(epidef))
+		count = this.cache.occurrences.get(occurrence, 0)
+		this.cache.occurrences[occurrence] = count + 1
+
+		key = (*occurrence, count)
+		cached = this.cache.methods.get(key)
+		if (cached is not None and cached[0] is definition and cached[1] is epidef):
+			return cached[2]
+
+		ret = definition.Bind(epidef)
+		this.cache.methods[key] = (definition, epidef, ret)
+		return ret
 
 
 	# Set this.precursor
@@ -734,22 +1818,26 @@ class Functor(Datum, BackwardsCompatible):
 			if (len(this.args) > len(this.arg.mapping)):
 				raise MissingArgumentError(f"{this.name} called with too many arguments. Got ({len(this.args)}) {this.args} but expected at most ({len(this.arg.mapping)}) {this.arg.mapping}")
 			argMap = dict(zip(this.arg.mapping[:len(this.args)], this.args))
-			logging.debug(f"Setting values from args: {argMap}")
+			Trace.Event(this, logging.DEBUG, 'args.map', "Setting values from args: {arguments}", arguments=argMap)
 			for arg, value in argMap.items():
 				this.Set(arg, value)
 
 		#NOTE: In order for *this to be called multiple times, required and optional kwargs must always be fetched and not use stale data from *this.
 
+		# All args are Fetched at once; see FetchMany().
+		plan = this.GetFetchPlan(this.fetch.use, exclude=['this'])
+
 		if (this.arg.kw.required):
-			for rkw in this.arg.kw.required:
-				if (this.feature.mapArgs):
-					if (rkw in argMap.keys()):
-						continue
-				
-				logging.debug(f"Fetching required value {rkw}...")
-				fetched, found = this.FetchWithout(['this'], rkw, start = False)
+			required = this.arg.kw.required
+			if (this.feature.mapArgs):
+				required = [rkw for rkw in required if rkw not in argMap.keys()]
+
+			Trace.Event(this, logging.DEBUG, 'args.required', "Fetching required values {varNames}...", varNames=required)
+			fetched = this.FetchManyUsingPlan(plan, required, start = False)
+			for rkw in required:
+				value, found = fetched[rkw]
 				if (found):
-					this.Set(rkw, fetched)
+					this.Set(rkw, value)
 					continue
 
 				# Nope. Failed.
@@ -757,12 +1845,13 @@ class Functor(Datum, BackwardsCompatible):
 				raise MissingArgumentError(f"Key-word argument {rkw} could not be Fetched.")
 
 		if (this.arg.kw.optional):
-			for okw, default in this.arg.kw.optional.items():
-				if (this.feature.mapArgs):
-					if (okw in argMap.keys()):
-						continue
+			optional = this.arg.kw.optional.keys()
+			if (this.feature.mapArgs):
+				optional = [okw for okw in optional if okw not in argMap.keys()]
 
-				this.Set(okw, this.FetchWithout(['this'], okw, default=default))
+			fetched = this.FetchManyUsingPlan(plan, optional, this.arg.kw.optional)
+			for okw in optional:
+				this.Set(okw, fetched[okw])
 
 	# When Fetching what to do next, everything is valid EXCEPT the environment. Otherwise, we could do something like `export next='nop'` and never quit.
 	# A similar situation arises when using the global config for each Functor. We only use the global config if *this has no precursor.
@@ -781,14 +1870,27 @@ class Functor(Datum, BackwardsCompatible):
 
 
 	# Make sure that precursors have provided all necessary methods for *this.
-	# NOTE: these should not be static nor cached, as calling something else before *this will change the behavior of *this.
+	# Calling something else before *this will change the methods of *this, so the result is only cached per method table (which is keyed by where the methods came from; see GetMethodTableKey()).
+	# If all required methods come from the method table or the class of *this, the same will be true of any other Functor with the same table, so they are not checked again.
 	def ValidateMethods(this):
+		key = (this.__class__, this.cache.methodTable, tuple(this.method.required))
+		if (this.cache.methodTable is not None and key in Functor.validMethodTables):
+			return
+
+		static = True
 		for method in this.method.required:
+			if (method in this.methods or callable(getattr(this.__class__, method, None))):
+				continue
+
+			static = False
 			if (util.HasAttr(this, method) and callable(util.GetAttr(this, method))):
 				continue
 
 			raise MissingMethodError(f"{this.name} has no method: {method}")
 
+		if (static and this.cache.methodTable is not None):
+			Functor.validMethodTables.add(key)
+
 
 	# Hook for whatever logic you'd like to run before the next Functor is called.
 	# ValidateNext will be called AFTER PrepareNext, so you don't need to make any readiness checks here.
@@ -884,7 +1986,10 @@ class Functor(Datum, BackwardsCompatible):
 	# RETURN boolean indicating whether or not *this is ready to do work.
 	def WarmUp(this, *args, **kwargs):
 		this.isWarm = False
-		logging.debug(f"Warming up {this.name}...")
+		this.cache.warm = None
+		Trace.Event(this, logging.DEBUG, 'warmup', "Warming up {name}...")
+
+		previousKwargs = this.kwargs
 
 		if (this.feature.track):
 			if (FunctorTracker.Instance().sequence.current.running):
@@ -911,6 +2016,18 @@ class Functor(Datum, BackwardsCompatible):
 
 		try:
 			this.PopulatePrecursor()
+
+			# Fetching from 'args' depends on this.kwargs, so each kwarg that changed is invalidated.
+			try:
+				if (this.kwargs is previousKwargs):
+					changedKwargs = kwargs.keys()
+				else:
+					changedKwargs = [key for key in set(this.kwargs) | set(previousKwargs) if key not in this.kwargs or key not in previousKwargs or this.kwargs[key] != previousKwargs[key]]
+				for key in changedKwargs:
+					FetchCache.Invalidate(key)
+			except:
+				FetchCache.Invalidate()
+
 			if (this.executor):
 				this.executor.BeginPlacing(this.name)
 			this.Initialize() # nop on call 2+
@@ -941,32 +2058,46 @@ class Functor(Datum, BackwardsCompatible):
 		return True
 
 
+	# Identify the inputs of a call, so that warm Functors know whether or not they need to WarmUp again.
+	# Args & kwargs are compared by value where they are hashable and by identity where they are not (so changing an unhashable arg in place will not be noticed).
+	# The executor's generation is included, so changes to its args, config, globals, or environment also require a WarmUp.
+	# RETURNS: a hashable fingerprint of the call.
+	def GetCallFingerprint(this, args, kwargs):
+		def Token(value):
+			try:
+				hash(value)
+				return (type(value), value)
+			except TypeError:
+				return (type(value), id(value))
+
+		return (
+			tuple([Token(arg) for arg in args]),
+			tuple(sorted([(key, Token(value)) for key, value in kwargs.items()])),
+			id(this.executor),
+			getattr(this.executor, 'generation', None),
+		)
+
+
 	# This is the () operator.
 	# Child classes don't need to worry about this; all relevant logic is abstracted to Function.
 	def __call__(this, *args, **kwargs) :
+		# What the Functors *this Fetches attributes from hold may change between calls (e.g. the result of the precursor) without being Set.
+		this.cache.attr = util.Cache()
+
 		if (this.feature.track):
 			FunctorTracker.Push(this)
 			this.Set('caller', FunctorTracker.GetLatest(1))
 
-		args_repr = [repr(arg) for arg in args]
-		kwargs_repr = {k: repr(v) for k, v in kwargs.items()}  
-		logging.info(f"{this.name} ({args_repr}, {kwargs_repr}) {{")
+		Trace.Event(this, logging.INFO, 'call.begin', "{name} ({args!r}, {kwargs!r}) {{", args=args, kwargs=kwargs)
 
 		ret = None
 		nextRet = None
 
 		try:
-			if (not this.isWarm):
+			if (not this.isWarm or (this.cache.warm is not None and this.GetCallFingerprint(args, kwargs) != this.cache.warm)):
 				this.WarmUp(*args, **kwargs)
-			else:
-				try:
-					# This particular bit of code if performant, but occasionally error prone.
-					# Particularly, this will fail if any arg is unhashable.
-					# in that case, we just say *this needs to be re-warmed.
-					if(not set(args).issubset(set(this.args)) or not set(kwargs.keys()).issubset(set(this.kwargs.keys()))):
-						this.WarmUp(*args, **kwargs)
-				except:
-					this.WarmUp(*args, **kwargs)
+				if (this.feature.stayWarm):
+					this.cache.warm = this.GetCallFingerprint(args, kwargs)
 
 			if (not this.feature.stayWarm):
 				this.isWarm = False
@@ -983,14 +2114,14 @@ class Functor(Datum, BackwardsCompatible):
 					FunctorTracker.InitiateSequence() # Has to be after WarmUp.
 
 			if (this.incomplete):
-				logging.debug(f"{this.name} incomplete.")
-				logging.info(f"return {ret}")
+				Trace.Event(this, logging.DEBUG, 'call.incomplete', "{name} incomplete.")
+				Trace.Event(this, logging.INFO, 'call.return', "return {value}", value=ret)
 				if (this.feature.track):
 					FunctorTracker.Pop(this)
-				logging.info(f"}} ({this.name})")
+				Trace.Event(this, logging.INFO, 'call.end', "}} ({name})")
 				return this
 
-			logging.debug(f"{this.name}({this.args}, {this.kwargs})")
+			Trace.Event(this, logging.DEBUG, 'call.function', "{name}({args}, {kwargs})", args=this.args, kwargs=this.kwargs)
 
 			getattr(this, f"Before{this.method.function}")()
 			ret = getattr(this, this.method.function)()
@@ -1037,10 +2168,11 @@ class Functor(Datum, BackwardsCompatible):
 
 			ret = this
 
-		logging.info(f"return {ret} ({[type(r) for r in ret] if type(ret) in [tuple, list] else type(ret)})")
+		if (Trace.Enabled(this, logging.INFO)):
+			Trace.Event(this, logging.INFO, 'call.return', "return {value} ({valueType})", value=ret, valueType=[type(r) for r in ret] if type(ret) in [tuple, list] else type(ret))
 		if (this.feature.track):
 			FunctorTracker.Pop(this)
-		logging.info(f"}} ({this.name})")
+		Trace.Event(this, logging.INFO, 'call.end', "}} ({name})")
 
 		return ret
 
@@ -1052,31 +2184,113 @@ class Functor(Datum, BackwardsCompatible):
 	# Reduce the work required to access return values.
 	# Make it possible to access related classes on the fly.
 	def __getattr__(this, attribute):
+		# We only get here if normal attribute lookup failed, so each tier below is checked without raising anything until we know the attribute is missing.
+		attributes = this.__dict__
+		if (attribute in attributes):
+			return attributes[attribute]
+
+		# Still being constructed.
+		if ('feature' not in attributes):
+			raise AttributeError(f"{this.__class__.__name__} has no attribute {attribute}")
+
+		obj, found = this.GetImplicitAttr(attribute)
+		if (found):
+			return obj
+
+		# These are class variables, and shouldn't be Fetched.
+		if (attribute in ['classMethods']):
+			raise AttributeError(f"{this.name} has no attribute {attribute}")
+
 		try:
-			this.__getattribute__(attribute)
-		except:
+			obj, found = this.FetchAttr(attribute)
+		except Exception as e:
+			raise AttributeError(f"{this.name} has no attribute {attribute}") from e
+		if (found):
+			return obj
+		raise AttributeError(f"{this.name} has no attribute {attribute}")
+
+
+	# Get an attribute of *this which normal attribute lookup can't find: either a backwards compatible name or a return value.
+	# RETURNS: a tuple of the value found (or None) and whether or not it was found.
+	def GetImplicitAttr(this, attribute):
+		compatibilities = this.cache.compatibilities
+		if (compatibilities and attribute in compatibilities):
 			try:
-				return this.__dict__[attribute]
-			except:
-				try:
-					return BackwardsCompatible.Get(this, attribute)
-				except:
-					try:
-						# Easy access to return values.
-						return this.result.data[attribute]
-					except:
-						try:
-							# These are class variables, and shouldn't be Fetched.
-							if (attribute in ['classMethods']):
-								raise AttributeError(f"{this.name} has no attribute {attribute}")
-
-							fetchFrom = this.fetch.attr.use
-							obj, found = this.Fetch(attribute, None, fetchFrom, start=False)
-							if (found):
-								return obj
-							raise AttributeError(f"{this.name} has no attribute {attribute}")
-						except:
-							raise AttributeError(f"{this.name} has no attribute {attribute}")
+				return BackwardsCompatible.Get(this, attribute), True
+			except AttributeError:
+				pass
+
+		# Easy access to return values.
+		result = this.__dict__.get('result')
+		if (result is not None):
+			data = result.data
+			if (isinstance(data, dict) and attribute in data):
+				return data[attribute], True
+
+		return None, False
+
+
+	# Get an attribute *this has, without Fetching it if it doesn't (see FetchAttr()).
+	# RETURNS: a tuple of the value found (or None) and whether or not it was found.
+	def GetOwnAttr(this, attribute):
+		try:
+			return object.__getattribute__(this, attribute), True
+		except AttributeError:
+			return this.GetImplicitAttr(attribute)
+
+
+	# Search the attributes *this has, without Fetching those it doesn't.
+	# This is how WalkFetchScope() searches 'this', since it walks fetch.attr.use itself.
+	# RETURNS: the same as fetch_location_this().
+	def FetchOwnAttribute(this, varName, default, fetchFrom, attempted):
+		attribute, dot, rest = varName.partition('.')
+		obj, found = this.GetOwnAttr(attribute)
+		if (not found):
+			return default, False
+
+		if (not dot):
+			return obj, True
+		try:
+			return util.GetAttr(obj, rest), True
+		except AttributeError:
+			return default, False
+
+
+	# Get the results of the __getattr__ Fetches made during the Fetch in progress on the current thread (see Functor.fetchState).
+	# RETURNS: a dict of {(id(Functor), attribute): (value, found)} or None, if no Fetch is in progress.
+	@staticmethod
+	def GetAttrFetches():
+		return getattr(Functor.fetchState, 'attrFetches', None)
+
+
+	# Fetch an attribute *this doesn't have from fetch.attr.use.
+	# Within a Fetch, the result is remembered until that Fetch completes (see Functor.fetchState).
+	# When feature.fetch.attrCache is enabled, the result (including whether or not the attribute was found at all) is also remembered in cache.attr until the attribute changes (see FetchCache.GetVersion()).
+	# RETURNS: a tuple of the value found (or None) and whether or not it was found.
+	def FetchAttr(this, attribute):
+		attrFetches = Functor.GetAttrFetches()
+		if (attrFetches is None):
+			if (not this.feature.fetch.attrCache):
+				return this.Fetch(attribute, None, this.fetch.attr.use, start=False)
+
+			version = FetchCache.GetVersion(attribute)
+			cached = this.cache.attr.get(attribute)
+			if (cached is not None and cached[0] == version):
+				return cached[1]
+			ret = this.Fetch(attribute, None, this.fetch.attr.use, start=False)
+			this.cache.attr[attribute] = (version, ret)
+			return ret
+
+		key = (id(this), attribute)
+		try:
+			return attrFetches[key]
+		except KeyError:
+			pass
+
+		# Looking for attribute again while we're still looking for it means we've found a cycle.
+		attrFetches[key] = (None, False)
+		attrFetches[key] = this.Fetch(attribute, None, this.fetch.attr.use, start=False)
+		return attrFetches[key]
 
 
 	# Adapter for @recoverable.
@@ -1088,7 +2302,7 @@ class Functor(Datum, BackwardsCompatible):
 	# Add support for deepcopy.
 	# Copies everything besides methods; those will be created by PopulateMethods or removed.
 	def __deepcopy__(this, memodict=None):
-		logging.debug(f"Creating new {this.__class__} from {this.name}")
+		Trace.Event(this, logging.DEBUG, 'copy', "Creating new {cls} from {name}", cls=this.__class__)
 		cls = this.__class__
 		ret = cls.__new__(cls)
 		ret.__init__()
@@ -1125,6 +2339,14 @@ class Functor(Datum, BackwardsCompatible):
 		ret.executor = this.executor
 		ret.epidef = this.epidef
 
+		# Cached Fetch results may depend on values which were not copied (e.g. kwargs).
+		ret.cache.fetch.results = util.Cache()
+		ret.cache.fetch.scopes = util.Cache()
+		ret.cache.fetch.stats = util.Cache()
+
+		# Methods are not copied; see PopulateMethods().
+		ret.cache.methodTable = None
+
 		return ret
 
 
@@ -1144,34 +2366,49 @@ class Functor(Datum, BackwardsCompatible):
 	# Avert your eyes!
 	# This is deep black magick fuckery.
 	# And no. There does not appear to be any other way to do this on CPython <=3.11
+	# The answer only depends on the caller's code object, so each is only disassembled once (see CodePerformsSequence()).
+	# To build a sequence without any of this, use eons.sequence().
 	def WillPerformSequence(this, backtrack=2):
-		if (not this.feature.sequential):
+		if (not this.feature.sequential or not this.feature.sequence.detect):
 			return False
-		
+
 		try:
-			# NOTE: 11 is apparently the code for the __truediv__ division operator (/). On this system. For now...
-			return [i for i in [i for i in dis.get_instructions(eval(f"inspect.currentframe(){'.f_back' * backtrack}.f_code")) if i.opname == 'BINARY_OP'] if i.arg == 11] > 0
+			return Functor.CodePerformsSequence(sys._getframe(backtrack).f_code)
 		except:
 			# Yeah...
 			return False
 
 
+	# RETURNS: whether or not the given code object uses the / operator (i.e. __truediv__).
+	@staticmethod
+	@functools.lru_cache(maxsize=1024)
+	def CodePerformsSequence(code):
+		for instruction in dis.get_instructions(code):
+			if (instruction.opname == 'BINARY_TRUE_DIVIDE' or (instruction.opname == 'BINARY_OP' and instruction.argrepr == '/')):
+				return True
+		return False
+
+
 	######## START: Fetch Locations ########
 
 	def fetch_location_this(this, varName, default, fetchFrom, attempted):
-		if (util.HasAttr(this, varName)):
+		# A single lookup, rather than HasAttr then GetAttr, since both may fall back to __getattr__.
+		try:
 			return util.GetAttr(this, varName), True
-		return default, False
+		except AttributeError:
+			return default, False
 
 	def fetch_location_args(this, varName, default, fetchFrom, attempted):
 
 		# this.args can't be searched.
 
-		for key, val in this.kwargs.items():
-			if (key == varName):
-				return val, True
+		if (varName in this.kwargs):
+			return this.kwargs[varName], True
 		return default, False
 
+	def fetch_many_location_args(this, varNames, defaults, fetchFrom, attempted):
+		return {varName: this.kwargs[varName] for varName in varNames if varName in this.kwargs}
+
 
 	def fetch_location_epidef(this, varName, default, fetchFrom, attempted):
 
@@ -1208,30 +2445,89 @@ class Functor(Datum, BackwardsCompatible):
 
 
 	#NOTE: There is no config in the default Functor. This is done for the convenience of children.
+	# Only the config of *this is searched; the configs of other Functors are searched when their scope is walked (see WalkFetchScope()).
 	def fetch_location_config(this, varName, default, fetchFrom, attempted):
-		if (not util.HasAttr(this, 'config') or this.config is None):
+		config, found = this.GetOwnAttr('config')
+		if (config is None):
 			return default, False
+		return this.FetchFromConfig(config, varName, default)
+
+	def fetch_many_location_config(this, varNames, defaults, fetchFrom, attempted):
+		config, found = this.GetOwnAttr('config')
+		if (config is None):
+			return {}
+		ret = {}
+		for varName in varNames:
+			value, found = this.FetchFromConfig(config, varName, None)
+			if (found):
+				ret[varName] = value
+		return ret
+
+
+	# Look up varName in the given config.
+	# If feature.fetch.dotted is enabled, 'a.b.c' may also be found as config['a']['b']['c'].
+	# RETURNS: a tuple of the value found (or default) and whether or not it was found.
+	def FetchFromConfig(this, config, varName, default):
+		try:
+			return config[varName], True
+		except (KeyError, TypeError):
+			pass
 
-		for key, val in dict(this.config).items():
-			if (key == varName):
-				return val, True
+		if (this.feature.fetch.dotted and '.' in varName):
+			return this.FetchFromPath(config, varName.split('.'), default)
 
 		return default, False
 
 
+	# Walk down a nested dictionary (e.g. a config) along the given path.
+	# RETURNS: a tuple of the value at the end of the path (or default) and whether or not the full path was found.
+	def FetchFromPath(this, node, path, default):
+		for key in path:
+			if (not isinstance(node, dict) or key not in node):
+				return default, False
+			node = node[key]
+		return node, True
+
+
+	# Plain names are looked up directly in builtins, which is always up to date.
+	# Dotted names have to be walked, so misses are remembered until Executor.SetGlobal / ExpireGlobal (see FetchCache.ForgetMisses()).
 	def fetch_location_globals(this, varName, default, fetchFrom, attempted):
-		if (util.HasAttr(builtins, varName)):
-			return util.GetAttr(builtins, varName), True
+		try:
+			return vars(builtins)[varName], True
+		except KeyError:
+			pass
+
+		if ('.' not in varName or FetchCache.IsMiss('globals', varName)):
+			return default, False
+
+		try:
+			if (util.HasAttr(builtins, varName)):
+				return util.GetAttr(builtins, varName), True
+		except AttributeError:
+			pass
+
+		FetchCache.AddMiss('globals', varName)
 		return default, False
 
 
+	# The Executor keeps a snapshot of the environment; see Executor.RefreshEnvironment().
+	# Without an Executor, we have to check the environment itself. Misses are remembered until the environment is refreshed.
 	def fetch_location_environment(this, varName, default, fetchFrom, attempted):
+		executor = this.GetExecutor()
+		if (executor):
+			return executor.GetEnvironmentVariable(varName, default)
+
+		if (FetchCache.IsMiss('environment', varName)):
+			return default, False
+
 		envVar = os.getenv(varName)
 		if (envVar is not None):
 			return envVar, True
 		envVar = os.getenv(varName.upper())
 		if (envVar is not None):
 			return envVar, True
+
+		FetchCache.AddMiss('environment', varName)
 		return default, False
 
 	######## END: Fetch Locations ########
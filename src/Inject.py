@@ -16,13 +16,23 @@ class Inject(Functor):
 		this.feature.autoReturn = False
 	
 	def Function(this):
+		kwargs = {key: value for key, value in this.kwargs.items() if key not in ['target', 'impl']}
+		return Inject.Create(this.target, this.impl, **kwargs)
+
+	# Create the Method which will replace target.
+	# This is what calling an Inject does, without the overhead of calling a Functor; see inject().
+	# RETURNS: a new Method of type impl.
+	@staticmethod
+	def Create(target, impl='External', **kwargs):
 		# Prepare a dummy function to replace with a Method.
-		code = compile(f"def {this.target}(this):\n\tpass", '', 'exec')
-		exec(code)
+		def placeholder(this):
+			pass
+		placeholder.__name__ = target
+		placeholder.__qualname__ = target
 
-		methodToAdd = SelfRegistering(this.impl)
-		methodToAdd.Constructor(eval(this.target), None)
-		for key, value in this.kwargs.items():
+		methodToAdd = SelfRegistering(impl)
+		methodToAdd.Constructor(placeholder, None)
+		for key, value in kwargs.items():
 			setattr(methodToAdd, key, value)
 
 		return methodToAdd
@@ -32,4 +42,4 @@ def inject(
 	impl="External",
 	**kwargs
 ):
-	return Inject()(target=target, impl=impl, **kwargs)
+	return Inject.Create(target, impl, **kwargs)
@@ -6,15 +6,89 @@ from .ExecutorTracker import ExecutorTracker
 from .Method import Method, PrepareClassMethod
 from .AccessControl import AccessControl
 from .Utils import util
+from .CodeCache import CodeCache
+import sys
+import ast
 import inspect
 import logging
+import linecache
+import functools
+import textwrap
 import re
 
+# Parse source which defines @kinds (e.g. a whole module).
+# Modules tend to define many kinds, so each source is only parsed once, no matter how many kinds it defines.
+# RETURNS: every function in source, in the form of {line the function starts on (including decorators): ast.FunctionDef}.
+@functools.lru_cache(maxsize=64)
+def ParseKindSource(source):
+	ret = {}
+	for node in ast.walk(ast.parse(source)):
+		if (isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))):
+			ret[min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])] = node
+	return ret
+
+
+# Find where function is defined, without tokenizing its file again (as inspect.getsource() would).
+# If source is given, it is used instead of the file function came from.
+# RETURNS: the lines of source function is in & the ast.FunctionDef of function.
+def GetKindDefinition(function, source=None):
+	lines = None
+	node = None
+	if (source is None):
+		try:
+			lines = linecache.getlines(inspect.getsourcefile(function), function.__globals__)
+		except TypeError:
+			pass
+		if (lines):
+			node = ParseKindSource(''.join(lines)).get(function.__code__.co_firstlineno)
+		if (node is None or node.name != function.__name__):
+			source = inspect.getsource(function)
+
+	if (source is not None):
+		lines = textwrap.dedent(source).splitlines(True)
+		functions = ParseKindSource(''.join(lines))
+		node = functions[min(functions.keys())]
+
+	return lines, node
+
+
+# Make the body of a @kind usable as the primary function of its Functor, by replacing each name in it with what it should be (e.g. {'arg': 'this.arg'}).
+# Only names are replaced; attributes, keywords, and strings (beside the expressions in f-strings) are left as they are.
+# RETURNS: the source of the body of node, with all replacements made.
+def MangleKindBody(lines, node, replacements):
+	first = node.body[0]
+	start = first.lineno - 1
+	end = getattr(node, 'end_lineno', None)
+	if (end is None):
+		end = node.lineno - 1 + len(inspect.getblock(lines[node.lineno - 1:]))
+
+	body = [line.encode('utf-8') for line in lines[start:end]]
+	names = [name for statement in node.body for name in ast.walk(statement) if isinstance(name, ast.Name) and name.id in replacements]
+
+	# Replace from the end, so that the remaining offsets stay valid.
+	for name in sorted(names, key=lambda name: (name.lineno, name.col_offset), reverse=True):
+		line = name.lineno - 1 - start
+		column = name.col_offset
+		original = name.id.encode('utf-8')
+		if (body[line][column:column + len(original)] != original):
+			raise SyntaxError(f"Unable to locate '{name.id}' on line {name.lineno} of {node.name}")
+		body[line] = body[line][:column] + replacements[name.id].encode('utf-8') + body[line][column + len(original):]
+
+	# For bodies on the same line as the def (e.g. "def Kind(): pass").
+	if (body[0][:first.col_offset].strip()):
+		body[0] = b'\t' + body[0][first.col_offset:]
+
+	ret = b''.join(body).decode('utf-8')
+	if (not ret.endswith('\n')):
+		ret += '\n'
+	return ret
+
+
 def kind(
 	base = StandardFunctor,
 	**kwargs
 ):
-	def ParseParameters(functor, args, source, ctor, strongType = False):
+	def ParseParameters(functor, args, replacements, ctor, strongType = False):
 		# Code duplicated from Method.PopulateFrom. See that class for more info.
 		for arg in args.values():
 			if (arg.name == 'constructor' or arg.name == '__init__'):
@@ -50,10 +124,10 @@ this.constructor()
 						shouldMapArg = False
 					elif (isinstance(arg.default, AccessControl)):
 						# NOTE: arg.name is discarded.
-						functor, source, ctor = ParseParameters(
+						functor, replacements, ctor = ParseParameters(
 							functor,
 							arg.default.parameters,
-							source,
+							replacements,
 							ctor,
 							strongType=strongType
 						)
@@ -77,11 +151,10 @@ this.constructor()
 				if (shouldMapArg):
 					ctor.source.append(f"this.arg.mapping.append('{arg.name}')")
 
-			# Source mangling
-			# TODO: Expand as we have more solid test cases.
-			source = re.sub(fr"{arg.name}([\s\[\]\.\(\)\}}\*\+/-=%,]|$)", fr"{replaceWith}\1", source)
-			
-		return functor, source, ctor
+			# Source mangling; see MangleKindBody().
+			replacements[arg.name] = replaceWith
+
+		return functor, replacements, ctor
 
 	# Python requires us to manually build the meta class when resolving diamod inheritance.
 	def GetCommonMetaClass(bases):
@@ -147,42 +220,40 @@ this.constructor()
 
 		if (args is None):
 			args = inspect.signature(function).parameters
-		if (source is None):
-			source = inspect.getsource(function)
-
-		source = source[source.find(':\n')+1:].strip() # Will fail if an arg has ':\n' in it
-		source = re.sub(r'(^|[\s\[\(\{\*\+/-=%\^,])epidef([\s\[\]\.\(\)\}\*\+/-=%\^,]|$)', r'\1this.epidef\2', source)
+		lines, definition = GetKindDefinition(function, source)
 
 		ctor = util.DotDict()
 		ctor.source = []
 		ctor.additions = ""
 
-		functor, source, ctor = ParseParameters(functor, args, source, ctor, strongType=strongType)
+		replacements = {'epidef': 'this.epidef'}
+		functor, replacements, ctor = ParseParameters(functor, args, replacements, ctor, strongType=strongType)
+		source = MangleKindBody(lines, definition, replacements)
 
 		# Constructor creation
+		# The constructor is made by a factory, so that the class it constructs can be bound to it directly, rather than searched for on every instantiation.
+		# The other lookups remain as fallbacks, in case the constructor is ever used by an unrelated class.
 		constructorName = f"_eons_constructor_{kwargs['name']}"
+		constructorFactoryName = f"_eons_constructor_factory_{kwargs['name']}"
 		constructorSource = f"def {constructorName}(this, name='{functorName}', **kwargs):"
 		constructorSource += "\n\timport sys"
 		constructorSource += "\n\timport eons"
 		constructorSource += f'''
 	this.name = name # For debugging
-	try:
-		{functor.__name__} = importedAs = eons.util.BlackMagick.GetCurrentFunction().__source_class__
-		if (not isinstance(this, {functor.__name__})):
-			raise Exception('{functor.__name__} not in source class')
-	except Exception as e1:
+	{functor.__name__} = _eons_source_class
+	if (not isinstance(this, {functor.__name__})):
 		try:
-			importedAs = eons.util.BlackMagick.GetCurrentFunction().__pivot_module__.f_locals['__imported_as__']
+			importedAs = _eons_pivot_module.f_locals['__imported_as__']
 			{functor.__name__} = sys.modules[importedAs].{functor.__name__}
 			if (not isinstance(this, {functor.__name__})):
-				raise Exception('{functor.__name__} not in {{importedAs}}')
-		except Exception as e2:
+				raise Exception(f'{functor.__name__} not in {{importedAs}}')
+		except Exception as e1:
 			try:
-				{functor.__name__} = sys.modules[{destinedModuleName}].{functor.__name__}
+				{functor.__name__} = sys.modules['{destinedModuleName}'].{functor.__name__}
 				if (not isinstance(this, {functor.__name__})):
 					raise Exception('{functor.__name__} not in {destinedModuleName}')
-			except Exception as e3:
-				logging.warning(f"Failed to initialize {functor.__name__}: \\n{{e1}}\\n{{e2}}\\n{{e3}}")
+			except Exception as e2:
+				logging.warning(f"Failed to initialize {functor.__name__}: \\n{{e1}}\\n{{e2}}")
 				# Catch all. This will cause an infinite loop if this != {functor.__name__}
 				{functor.__name__} = this.__class__
 	this.parent = type(this).mro()[1]
@@ -193,22 +264,20 @@ this.constructor()
 		if (len(ctor.additions)):
 			re.sub(r'^\s+', '\n', ctor.additions)
 			constructorSource += '\n\t' + ('\n\t'.join(ctor.additions.split('\n'))).replace('self', 'this')
+		constructorSource = f"def {constructorFactoryName}(_eons_source_class, _eons_pivot_module):\n\t" + constructorSource.replace('\n', '\n\t') + f"\n\treturn {constructorName}\n"
 		if (shouldLog):
 			logging.debug(f"Constructor source for {kwargs['name']}:\n{constructorSource}")
-		code = compile(constructorSource, '', 'exec')
+		code = CodeCache.Compile(constructorSource)
 		exec(code)
-		exec(f'functor.__init__ = {constructorName}')
+		exec(f'functor.__init__ = {constructorFactoryName}(functor, pivotModule)')
 		functor.__init__.__source_class__ = functor
 		functor.__init__.__pivot_module__ = pivotModule
 
 		wrappedPrimaryFunction = f"_eons_method_{kwargs['name']}"
-		completeSource = f'''\
-def {wrappedPrimaryFunction}(this):
-	{source}
-'''
+		completeSource = f"def {wrappedPrimaryFunction}(this):\n{source}"
 		if (shouldLog):
 			logging.debug(f"Primary function source for {kwargs['name']}:\n{completeSource}")
-		code = compile(completeSource, '', 'exec')
+		code = CodeCache.Compile(completeSource)
 		exec(code)
 		exec(f'functor.{primaryFunctionName} = {wrappedPrimaryFunction}')
 
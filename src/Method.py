@@ -5,6 +5,8 @@ from .Exceptions import *
 from .SelfRegistering import SelfRegistering
 from .Functor import Functor
 from .Utils import util
+from .CodeCache import CodeCache
+from copy import deepcopy
 
 def GetPendingMethod(methodName):
 	def METHOD_PENDING_POPULATION(obj, *args, **kwargs):
@@ -103,19 +105,48 @@ class Method(Functor):
 
 		this.arg.mapping = ['epidef']
 
+		# The Method *this was bound from (see Bind()), or None, if *this is a definition (e.g. from a classMethods dict).
+		# Definitions are shared by all instances of a class and should not be called directly.
+		this.definition = None
+		this.prevent.copying.append('definition')
+
+		# Functions compiled from this.source, in the form of {source: function}.
+		# Only used on definitions; bound Methods share the functions of their definition.
+		this.compiled = {}
+		this.prevent.copying.append('compiled')
+
 
 	# Make *this execute the code in this.source
+	# The source is only compiled once per definition; see Bind().
 	def UpdateSource(this):
-		wrappedFunctionName = f'_eons_method_{this.name}'
-		completeSource = f'''\
+		definition = this.definition if this.definition is not None else this
+		function = definition.compiled.get(this.source)
+		if (function is None):
+			wrappedFunctionName = f'_eons_method_{this.name}'
+			completeSource = f'''\
 def {wrappedFunctionName}(this):
 {this.source}
 '''
-		if (this.executor and this.executor.verbosity > 3):
-			logging.debug(f"Source for {this.name} is:\n{completeSource}")
-		code = compile(completeSource, '', 'exec')
-		exec(code)
-		exec(f'this.Function = {wrappedFunctionName}.__get__(this, this.__class__)')
+			if (this.executor and this.executor.verbosity > 3):
+				logging.debug(f"Source for {this.name} is:\n{completeSource}")
+			code = CodeCache.Compile(completeSource)
+			compiled = {}
+			exec(code, globals(), compiled)
+			function = compiled[wrappedFunctionName]
+			definition.compiled[this.source] = function
+		this.Function = function.__get__(this, this.__class__)
+
+
+	# Create a Method which will call *this on behalf of epidef.
+	# *this is not changed, so the same definition can be bound to any number of Functors. See Functor.BindMethod() for how bound Methods are reused.
+	# RETURNS: a new Method, ready to be called.
+	def Bind(this, epidef):
+		definition = this.definition if this.definition is not None else this
+		ret = deepcopy(definition)
+		ret.definition = definition
+		ret.epidef = epidef
+		ret.UpdateSource()
+		return ret
 
 
 	# Parse arguments and update the source code
@@ -0,0 +1,21 @@
+from .SelfRegistering import SelfRegistering
+from .ExecutorTracker import ExecutorTracker
+
+# Call each of the given Functors in order, each with the one before it as its precursor.
+# sequence(first, second, third) is the same as first() / second() / third(), but without relying on Functor.WillPerformSequence().
+# Functors may be given by name, in which case they are found with the latest Executor (see Executor.GetRegistered()).
+# Any kwargs are given to the first Functor.
+# RETURNS: the result of the last Functor.
+def sequence(
+	first,
+	*rest,
+	**kwargs
+):
+	if (isinstance(first, str)):
+		executor = ExecutorTracker.GetLatest()
+		if (executor):
+			first = executor.GetRegistered(first)
+		else:
+			first = SelfRegistering(first)
+
+	return first(next=list(rest), **kwargs)
@@ -0,0 +1,58 @@
+import sys
+import logging
+from .Exceptions import *
+
+# A TraceEvent is a structured log message.
+# The message is only formatted when it is actually emitted (i.e. when a handler calls str() on it).
+# The event, source name, and details are also available to handlers as record.trace (see Trace.Event).
+class TraceEvent:
+	def __init__(this, source, event, message, details):
+		this.source = source
+		this.event = event
+		this.message = message
+		this.details = details
+
+	def __str__(this):
+		try:
+			return this.message.format(name=this.source.name, **this.details)
+		except Exception as e:
+			return f"{this.event} {this.details} (unable to format: {e})"
+
+
+# Trace is a namespace for cheap, structured logging on hot paths (e.g. Functor.__call__ and Fetch).
+# Instead of building f-strings that are usually thrown away, call Trace.Event(this, logging.DEBUG, 'some.event', "{name} did {what}", what=...).
+# Nothing is formatted unless the event would be logged.
+#
+# Tracing can be controlled per class by setting the 'tracing' class member:
+#	True: follow the logging level (default).
+#	False: never trace events from this class.
+#	A logging level (e.g. logging.WARNING): drop all events from this class below that level.
+# For example: eons.Functor.tracing = logging.INFO will silence all Fetch debugging while leaving call logs intact.
+class Trace:
+	def __init__(this):
+		raise NotInstantiableError("Trace is a namespace, not a class; it cannot be instantiated.")
+
+	# RETURNS whether or not an event of the given level from the given source would be logged.
+	# Use this to avoid building expensive details when tracing is off.
+	@staticmethod
+	def Enabled(source, level):
+		tracing = getattr(type(source), 'tracing', True)
+		if (tracing is False):
+			return False
+		if (tracing is not True and level < tracing):
+			return False
+		return logging.root.isEnabledFor(level)
+
+	# Log a structured event.
+	# The message is a str.format template which may reference {name} (i.e. source.name) and any of the details.
+	# The source, level, event, and message are taken positionally, so that details may use any name (e.g. source=...).
+	@staticmethod
+	def Event(*args, **details):
+		source, level, event, message = args
+		if (not Trace.Enabled(source, level)):
+			return
+		kwargs = {'extra': {'trace': {'event': event, 'name': source.name, 'details': details}}}
+		# Attribute the record to our caller, rather than to Trace (only supported in python 3.8+).
+		if (sys.version_info >= (3, 8)):
+			kwargs['stacklevel'] = 2
+		logging.root.log(level, TraceEvent(source, event, message, details), **kwargs)
@@ -3,6 +3,8 @@ import logging
 import jsonpickle
 import inspect
 import gc
+import functools
+import operator
 from .Exceptions import *
 from copy import deepcopy
 
@@ -26,26 +28,116 @@ class util:
 		def flatten(this, dotdict, data):
 			return dict(dotdict)
 
+	# A DotDictView is a read-only DotDict over a nested dict (e.g. a parsed config).
+	# Values are converted (with convert, if given) only when they are first accessed, and each converted value is remembered.
+	# Nested dicts become DotDictViews themselves, so only the parts of the source which are actually used are ever converted.
+	# NOTE: the source is not copied, beyond the keys at each level. Changing it after a value has been accessed will not change that value.
+	# To get a mutable copy, use copy() or util.DotDict(view).
+	class DotDictView(dict):
+		def __init__(this, source, convert=None):
+			super().__init__(source)
+			object.__setattr__(this, 'convert', convert)
+			object.__setattr__(this, 'converted', set())
+
+		def __getitem__(this, key):
+			if (key in this.converted):
+				return dict.__getitem__(this, key)
+			value = dict.__getitem__(this, key)
+			if (isinstance(value, dict) and not isinstance(value, util.DotDictView)):
+				value = util.DotDictView(value, this.convert)
+			elif (this.convert is not None):
+				value = this.convert(value)
+			dict.__setitem__(this, key, value)
+			this.converted.add(key)
+			return value
+
+		def get(this, key, default=None):
+			try:
+				return this[key]
+			except KeyError:
+				return default
+
+		def __getattr__(this, name):
+			return this.get(name)
+
+		# Defining __iter__ makes dict(view) (and {**view}) go through __getitem__, rather than copying unconverted values.
+		def __iter__(this):
+			return dict.__iter__(this)
+
+		def values(this):
+			return [this[key] for key in this]
+
+		def items(this):
+			return [(key, this[key]) for key in this]
+
+		def copy(this):
+			return util.DotDict(this)
+
+		def __eq__(this, other):
+			return dict(this) == other
+
+		def __ne__(this, other):
+			return not this == other
+
+		# Views are read-only, so copies can share them.
+		def __deepcopy__(this, memo=None):
+			return this
+
+		def ReadOnly(this, *args, **kwargs):
+			raise TypeError(f"DotDictView is read-only; use copy() to get a mutable DotDict.")
+
+		__setitem__ = ReadOnly
+		__setattr__ = ReadOnly
+		__delitem__ = ReadOnly
+		__delattr__ = ReadOnly
+		update = ReadOnly
+		pop = ReadOnly
+		popitem = ReadOnly
+		setdefault = ReadOnly
+		clear = ReadOnly
+		__ior__ = ReadOnly
+
+	# A Cache is a dict which is never copied.
+	# Caches often hold references to other objects (e.g. other Functors), which should not be dragged along when their owner is deepcopied.
+	class Cache(dict):
+		def __deepcopy__(this, memo=None):
+			return util.Cache()
+
+	# Compile a dotted attribute path (e.g. "a.b.c") into a getter, like operator.attrgetter.
+	# Accessors are cached per path, so each path is only split once.
+	# RETURNS: a function which takes an object and returns the value at attrStr.
+	@staticmethod
+	@functools.lru_cache(maxsize=1024)
+	def GetAttrGetter(attrStr):
+		return operator.attrgetter(attrStr)
+
+	# Compile a dotted attribute path (e.g. "a.b.c") into a setter.
+	# The parent of the last attribute is resolved with a getter, then the last attribute is set on it.
+	# RETURNS: a function which takes an object and a value and sets attrStr on the object to the value.
 	@staticmethod
-	def RecursiveAttrFunc(func, obj, attrList):
-		attr = attrList.pop(0)
-		if (not attrList):
-			return eval(f"{func}attr(obj, attr)")
-		if (not hasattr(obj, attr)):
-			raise AttributeError(f"{obj} has not attribute '{attr}'")
-		return util.RecursiveAttrFunc(func, getattr(obj, attr), attrList)
+	@functools.lru_cache(maxsize=1024)
+	def GetAttrSetter(attrStr):
+		parent, dot, attr = attrStr.rpartition('.')
+		if (not dot):
+			return lambda obj, value: setattr(obj, attr, value)
+		getParent = operator.attrgetter(parent)
+		return lambda obj, value: setattr(getParent(obj), attr, value)
 
 	@staticmethod
 	def HasAttr(obj, attrStr):
-		return util.RecursiveAttrFunc('has', obj, attrStr.split('.'))
+		try:
+			util.GetAttrGetter(attrStr)(obj)
+			return True
+		except AttributeError:
+			return False
 
 	@staticmethod
 	def GetAttr(obj, attrStr):
-		return util.RecursiveAttrFunc('get', obj, attrStr.split('.'))
+		return util.GetAttrGetter(attrStr)(obj)
 
 	@staticmethod
-	def SetAttr(obj, attrStr):
-		raise NotImplementedError(f"util.SetAttr has not been implemented yet.")
+	def SetAttr(obj, attrStr, value):
+		util.GetAttrSetter(attrStr)(obj, value)
 
 
 	@staticmethod
@@ -174,3 +266,4 @@ class util:
 			return None
 
 jsonpickle.handlers.registry.register(util.DotDict, util.DotDictPickler)
+jsonpickle.handlers.registry.register(util.DotDictView, util.DotDictPickler)
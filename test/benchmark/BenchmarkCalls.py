@@ -0,0 +1,90 @@
+# Measure how many Functor calls can be made per second.
+# Run with: python BenchmarkCalls.py [seconds per case]
+import sys
+import time
+import logging
+import eons
+
+class BenchmarkExecutor(eons.Executor):
+	def __init__(this, name="Benchmark Executor"):
+		super().__init__(name)
+
+	def AddArgs(this):
+		pass
+
+	def ParseArgs(this):
+		pass
+
+class BenchmarkFunctor(eons.StandardFunctor):
+	def __init__(this, name="BenchmarkFunctor"):
+		super().__init__(name)
+		this.feature.autoReturn = False
+		this.arg.kw.required.append('first')
+		this.arg.kw.required.append('first')
+		this.arg.kw.optional['second'] = 2
+		this.arg.kw.optional['third'] = 'three'
+		this.arg.mapping.append('first')
+		this.program.required.append('python3')
+
+	def Function(this):
+		return this.first
+
+class BenchmarkStage(eons.StandardFunctor):
+	def __init__(this, name="BenchmarkStage"):
+		super().__init__(name)
+		this.feature.autoReturn = False
+		this.arg.kw.required.append('first')
+		this.arg.mapping.append('first')
+		this.method.required.append('Step')
+
+	def Function(this):
+		return this.Step()
+
+	@eons.method(propagate=True)
+	def Step(this):
+		return this.first
+
+def Measure(name, seconds, call):
+	calls = 0
+	start = time.perf_counter()
+	end = start + seconds
+	while (time.perf_counter() < end):
+		call()
+		calls += 1
+	elapsed = time.perf_counter() - start
+	print(f"{name:<32} {calls / elapsed:>10.0f} calls/sec")
+
+def Benchmark(seconds=2.0):
+	logging.getLogger().setLevel(logging.ERROR)
+	executor = BenchmarkExecutor()
+	executor.parsedArgs = eons.util.DotDict({'no_repo': True, 'verbose': 0, 'config': None})
+	executor.extraArgs = {}
+	executor()
+	logging.getLogger().setLevel(logging.ERROR)
+
+	warm = BenchmarkFunctor()
+	warm.executor = executor
+
+	# Construction is excluded here; see "new Functor per call" for that.
+	best = None
+	for attempt in range(5):
+		functors = [BenchmarkFunctor() for i in range(1000)]
+		start = time.perf_counter()
+		for functor in functors:
+			functor.Initialize()
+		elapsed = time.perf_counter() - start
+		if (best is None or elapsed < best):
+			best = elapsed
+	print(f"{'Initialize only':<32} {1000 / best:>10.0f} calls/sec")
+
+	Measure("new Functor per call", seconds, lambda: BenchmarkFunctor()(1, executor=executor))
+	Measure("same Functor, each call cold", seconds, lambda: warm(1, executor=executor))
+
+	# Each stage inherits the methods of the one before it.
+	previous = BenchmarkStage()
+	previous(1, executor=executor)
+	stage = BenchmarkStage()
+	Measure("stage after identical stage", seconds, lambda: stage(1, executor=executor, precursor=previous))
+
+if __name__ == '__main__':
+	Benchmark(float(sys.argv[1]) if len(sys.argv) > 1 else 2.0)
@@ -0,0 +1,65 @@
+# Measure how long it takes to Fetch a missing variable down chains of precursors, as the chain grows.
+# Each Functor in the chain should only be searched once (or a few times), so the time taken should grow linearly with the length of the chain.
+# Run with: python BenchmarkFetchChain.py [longest chain]
+import sys
+import time
+import logging
+import eons
+
+class BenchmarkExecutor(eons.Executor):
+	def __init__(this, name="Benchmark Executor"):
+		super().__init__(name)
+
+	def AddArgs(this):
+		pass
+
+	def ParseArgs(this):
+		pass
+
+class BenchmarkFunctor(eons.StandardFunctor):
+	def __init__(this, name="Benchmark Functor"):
+		super().__init__(name)
+
+	def Function(this):
+		pass
+
+def MakeChain(executor, length):
+	chain = []
+	for i in range(length):
+		functor = BenchmarkFunctor()
+		functor.Initialize()
+		functor.executor = executor
+		functor.fetch.depth = length
+		if (chain):
+			functor.precursor = chain[-1]
+		chain.append(functor)
+	return chain
+
+def Benchmark(longest=400):
+	logging.getLogger().setLevel(logging.ERROR)
+	executor = BenchmarkExecutor()
+	executor.parsedArgs = eons.util.DotDict({'no_repo': True, 'verbose': 0, 'config': None})
+	executor.extraArgs = {}
+	executor()
+	logging.getLogger().setLevel(logging.ERROR)
+
+	previous = None
+	length = 50
+	while (length <= longest):
+		chain = MakeChain(executor, length)
+
+		start = time.perf_counter()
+		chain[-1].Fetch('benchmark_missing', None)
+		first = time.perf_counter() - start
+
+		start = time.perf_counter()
+		chain[-1].Fetch('benchmark_missing', None)
+		repeat = time.perf_counter() - start
+
+		growth = f"{first / previous:>6.2f}x" if previous else ''
+		print(f"{f'chain of {length}':<32} {first * 1000:>10.1f} ms (repeat: {repeat * 1000:.1f} ms) {growth}")
+		previous = first
+		length *= 2
+
+if __name__ == '__main__':
+	Benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 400)
@@ -0,0 +1,99 @@
+# Measure how long it takes to define @kinds and how many @kind Functors can be constructed per second, as the heap grows.
+# Run with: python BenchmarkKind.py [seconds per case] [kinds to define]
+import os
+import sys
+import time
+import logging
+import tempfile
+import importlib
+import eons
+
+class BenchmarkExecutor(eons.Executor):
+	def __init__(this, name="Benchmark Executor"):
+		super().__init__(name)
+
+	def AddArgs(this):
+		pass
+
+	def ParseArgs(this):
+		pass
+
+@eons.kind(eons.StandardFunctor)
+def BenchmarkKind(
+	first,
+	second = 2,
+	third = 'three',
+):
+	return first
+
+def Measure(name, seconds, call):
+	calls = 0
+	start = time.perf_counter()
+	end = start + seconds
+	while (time.perf_counter() < end):
+		call()
+		calls += 1
+	elapsed = time.perf_counter() - start
+	print(f"{name:<32} {calls / elapsed:>10.0f} calls/sec")
+
+# Write a module with the given number of @kinds, like those in a large library.
+def WriteKinds(directory, moduleName, kinds):
+	source = "import eons\n"
+	for i in range(kinds):
+		source += f'''
+@eons.kind(eons.StandardFunctor)
+def {moduleName}_{i}(
+	first,
+	second = 2,
+	third = 'three',
+	public = eons.public_methods(
+		'{moduleName}_helper_{i}',
+		other = '{moduleName}_other_{i}'
+	),
+	constructor = f"""
+this.value = {i}
+""",
+):
+	value = first + second
+	if (value > {i}):
+		return other({moduleName}_helper_{i}(first, third))
+	return value
+'''
+	with open(os.path.join(directory, f"{moduleName}.py"), 'w') as file:
+		file.write(source)
+
+def Benchmark(seconds=2.0, kinds=400):
+	logging.getLogger().setLevel(logging.ERROR)
+	executor = BenchmarkExecutor()
+	executor.parsedArgs = eons.util.DotDict({'no_repo': True, 'verbose': 0, 'config': None})
+	executor.extraArgs = {}
+	executor()
+	logging.getLogger().setLevel(logging.ERROR)
+
+	# Each attempt imports a new module, so nothing is reused between attempts (beside what eons caches itself).
+	with tempfile.TemporaryDirectory() as directory:
+		sys.path.insert(0, directory)
+		best = None
+		for attempt in range(3):
+			moduleName = f"benchmark_kinds_{attempt}"
+			WriteKinds(directory, moduleName, kinds)
+			importlib.invalidate_caches()
+			start = time.perf_counter()
+			importlib.import_module(moduleName)
+			elapsed = time.perf_counter() - start
+			if (best is None or elapsed < best):
+				best = elapsed
+		sys.path.remove(directory)
+	print(f"{f'define {kinds} kinds':<32} {best:>10.3f} sec")
+
+	# Objects tracked by the garbage collector; these are what a heap scan has to wade through.
+	heap = []
+	for size in [0, 100000, 1000000]:
+		heap.extend([[i] for i in range(size - len(heap))])
+		Measure(f"construct with {size} objects", seconds, BenchmarkKind)
+
+if __name__ == '__main__':
+	Benchmark(
+		float(sys.argv[1]) if len(sys.argv) > 1 else 2.0,
+		int(sys.argv[2]) if len(sys.argv) > 2 else 400
+	)
@@ -0,0 +1,39 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TypedFunctor(eons.StandardFunctor):
+	def __init__(this, name="TypedFunctor", value=None):
+		super().__init__(name)
+		this.value = value
+
+class TestArgType(StandardTestFixture):
+
+	def test_arg_type(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.arg.type['typed_int'] = int
+		functor.arg.type['typed_list'] = list
+		functor.arg.type['typed_functor'] = TypedFunctor
+		functor.Initialize()
+		assert ('typed_int' in functor.cache.coercers)
+
+		functor.Set('typed_int', '3')
+		assert (functor.typed_int == 3)
+
+		source = [1, 2]
+		functor.Set('typed_list', source)
+		assert (functor.typed_list == source and functor.typed_list is not source)
+
+		functor.Set('typed_functor', 'value')
+		typed = functor.typed_functor
+		assert (isinstance(typed, TypedFunctor) and typed.value == 'value' and typed.epidef is functor)
+
+		# The same value reuses the same Functor.
+		functor.Set('typed_functor', 'value')
+		assert (functor.typed_functor is typed)
+		functor.Set('typed_functor', 'other')
+		assert (functor.typed_functor is not typed and functor.typed_functor.value == 'other')
+
+		# Changing arg.type is noticed.
+		functor.arg.type['typed_int'] = float
+		functor.Set('typed_int', '3')
+		assert (functor.typed_int == 3.0 and type(functor.typed_int) is float)
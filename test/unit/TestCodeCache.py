@@ -0,0 +1,41 @@
+import os
+import tempfile
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestCodeCache(StandardTestFixture):
+
+	def test_code_cache_memory(this):
+		source = "def _eons_test_code_cache(this):\n\treturn this\n"
+		code = eons.CodeCache.Compile(source)
+		assert (eons.CodeCache.Compile(source) is code)
+		assert (eons.CodeCache.Compile(source + "\n") is not code)
+
+	def test_code_cache_disk(this):
+		source = "def _eons_test_code_cache_disk(this):\n\treturn this + 1\n"
+		with tempfile.TemporaryDirectory() as directory:
+			try:
+				eons.CodeCache.SetDirectory(directory)
+				code = eons.CodeCache.Compile(source)
+				path = eons.CodeCache.GetPath(directory, source, '', 'exec')
+				assert (os.path.isfile(path))
+
+				# A new process would only have the disk.
+				eons.CodeCache.Clear()
+				loaded = eons.CodeCache.Compile(source)
+				assert (loaded is not code)
+				assert (loaded == code)
+
+				namespace = {}
+				exec(loaded, namespace)
+				assert (namespace['_eons_test_code_cache_disk'](1) == 2)
+
+				# Unusable files are recompiled and replaced.
+				with open(path, 'wb') as file:
+					file.write(b'not code')
+				eons.CodeCache.Clear()
+				assert (eons.CodeCache.Compile(source) == code)
+				assert (eons.CodeCache.Load(path) == code)
+			finally:
+				eons.CodeCache.SetDirectory(None)
+				eons.CodeCache.Clear()
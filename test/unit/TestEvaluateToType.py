@@ -0,0 +1,99 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestEvaluateToType(StandardTestFixture):
+
+	def test_templates(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.template_value = 3
+
+		assert (functor.EvaluateToType("{this.template_value}") == 3)
+		assert (functor.EvaluateToType("value: {this.template_value}") == "value: 3")
+		assert (functor.EvaluateToType("{{escaped}}") == "{escaped}")
+
+		# Braces without expressions are left alone.
+		assert (functor.EvaluateToType("{}") == "{}")
+
+		# The same template is only compiled once.
+		eons.Functor.CompileTemplate("{this.template_value}")
+		hits = eons.Functor.CompileTemplate.cache_info().hits
+		functor.template_value = 4
+		assert (functor.EvaluateToType("{this.template_value}") == 4)
+		assert (eons.Functor.CompileTemplate.cache_info().hits == hits + 1)
+
+	def test_containers(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		config = {
+			'list': ['1', '1.5', 'true', 'None', 'string', '01'],
+			'nested': {'typed': [1, 2, 3], 'more': [{'deep': 'false'}]},
+		}
+
+		ret = functor.EvaluateToType(config)
+		assert (ret.list == [1, 1.5, True, None, 'string', '01'])
+		assert (isinstance(ret.nested, eons.util.DotDict))
+		assert (ret.nested.typed == [1, 2, 3] and ret.nested.typed is not config['nested']['typed'])
+		assert (ret.nested.more[0].deep is False)
+
+	def test_numeric_buffers(this):
+		import array
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.feature.numericBuffers = 'array'
+
+		ret = functor.EvaluateToType({'ints': ['1', '2', '3'], 'floats': [1.5, 2.5], 'mixed': [1, 2.5], 'strings': ['a']})
+		assert (isinstance(ret.ints, array.array) and list(ret.ints) == [1, 2, 3])
+		assert (isinstance(ret.floats, array.array) and list(ret.floats) == [1.5, 2.5])
+		assert (ret.mixed == [1, 2.5])
+		assert (ret.strings == ['a'])
+
+	def test_lazy_dicts(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.feature.lazyDicts = True
+		functor.template_value = 3
+		config = {
+			'value': '{this.template_value}',
+			'nested': {'flag': 'true', 'list': ['1', '2']},
+			'unused': {'deep': 'false'},
+		}
+
+		ret = functor.EvaluateToType(config)
+		assert (isinstance(ret, eons.util.DotDictView))
+		assert (ret.value == 3)
+		assert (ret['nested'].flag is True)
+		assert (ret.nested.list == [1, 2])
+		assert (ret.missing is None)
+
+		# Only what was accessed has been converted.
+		assert ('unused' not in ret.converted)
+
+		# The same config is only wrapped once.
+		assert (functor.EvaluateToType(config) is ret)
+
+		try:
+			ret.value = 4
+			assert False
+		except TypeError:
+			pass
+
+		copied = ret.copy()
+		copied.value = 4
+		assert (copied.unused.deep is False)
+		assert (ret.value == 3 and config['value'] == '{this.template_value}')
+
+	def test_lazy_dict_invalidation(this):
+		# Views are opt-in, even for Executors, since fetched dicts may be written to.
+		assert (not this.executor.feature.lazyDicts)
+		assert (isinstance(this.executor.EvaluateToType({'value': '1'}), eons.util.DotDict))
+
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.feature.lazyDicts = True
+		config = {'value': '1'}
+		ret = functor.EvaluateToType(config)
+		assert (functor.EvaluateToType(config) is ret)
+
+		# Views are dropped when something changes, since the dicts they wrap may have changed too.
+		config['value'] = '2'
+		functor.Set('lazy_changed', True)
+		changed = functor.EvaluateToType(config)
+		assert (changed is not ret)
+		assert (changed.value == 2)
+		assert (len(functor.cache.views) == 1)
@@ -0,0 +1,70 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestFetchAdapt(StandardTestFixture):
+
+	def test_adapt_guarantee(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.executor = this.executor
+		functor.feature.fetch.adapt = True
+		functor.fetch.adapt.probes = 3
+		functor.fetch.use = ['args', 'config', 'globals', 'environment']
+
+		this.executor.SetGlobal('adapt_global', 'global')
+		for i in range(functor.fetch.adapt.probes):
+			assert (functor.Fetch('adapt_global') == 'global')
+
+		# globals was the only location with adapt_global, so it is now searched first.
+		plan = functor.AdaptFetchPlan(functor.GetFetchPlan(functor.fetch.use), 'adapt_global')
+		assert (plan.use == ('args', 'globals', 'config', 'environment'))
+		assert (functor.Fetch('adapt_global') == 'global')
+		this.executor.ExpireGlobal('adapt_global')
+
+	def test_adapt_guarantee_overlap(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.feature.fetch.adapt = True
+		functor.fetch.adapt.probes = 3
+		functor.fetch.use = ['args', 'config', 'globals']
+		functor.config = {'adapt_overlap': 'config'}
+
+		this.executor.SetGlobal('adapt_overlap', 'global')
+		for i in range(functor.fetch.adapt.probes + 2):
+			assert (functor.Fetch('adapt_overlap') == 'config')
+
+		# Both config and globals have adapt_overlap, so they must not be reordered.
+		plan = functor.AdaptFetchPlan(functor.GetFetchPlan(functor.fetch.use), 'adapt_overlap')
+		assert (plan.use == ('args', 'config', 'globals'))
+		this.executor.ExpireGlobal('adapt_overlap')
+
+	def test_adapt_per_instance(this):
+		learner = this.executor.GetRegistered('HelloFunctor')
+		learner.Initialize()
+		learner.executor = this.executor
+		learner.feature.fetch.adapt = True
+		learner.fetch.adapt.probes = 3
+		learner.fetch.use = ['args', 'config', 'globals']
+
+		this.executor.SetGlobal('adapt_instance', 'global')
+		for i in range(learner.fetch.adapt.probes):
+			assert (learner.Fetch('adapt_instance') == 'global')
+		plan = learner.AdaptFetchPlan(learner.GetFetchPlan(learner.fetch.use), 'adapt_instance')
+		assert (plan.use == ('args', 'globals', 'config'))
+
+		# What learner learned does not apply to other Functors of the same class.
+		other = this.executor.GetRegistered('HelloFunctor')
+		other.Initialize()
+		other.executor = this.executor
+		other.feature.fetch.adapt = True
+		other.fetch.adapt.probes = 3
+		other.fetch.use = ['args', 'config', 'globals']
+		other.config = {'adapt_instance': 'config'}
+		for i in range(other.fetch.adapt.probes + 2):
+			assert (other.Fetch('adapt_instance') == 'config')
+
+		# Nor does it outlive a change.
+		learner.config = {'adapt_instance': 'config'}
+		learner.InvalidateFetchCache()
+		assert (learner.Fetch('adapt_instance') == 'config')
+		this.executor.ExpireGlobal('adapt_instance')
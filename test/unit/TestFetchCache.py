@@ -0,0 +1,108 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestFetchCache(StandardTestFixture):
+
+	def test_fetch_cache_hit(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.feature.fetch.cache = True
+		functor.kwargs = {'cached_value': 'first'}
+
+		locations = []
+		functor.callback.fetch = lambda varName, location, value: locations.append(location)
+
+		assert (functor.Fetch('cached_value') == 'first')
+
+		# Direct assignment is not tracked...
+		functor.kwargs = {'cached_value': 'second'}
+		assert (functor.Fetch('cached_value') == 'first')
+
+		# ...until the cache is invalidated.
+		functor.InvalidateFetchCache()
+		assert (functor.Fetch('cached_value') == 'second')
+		assert (locations == ['args', 'args', 'args'])
+
+		functor.callback.fetch = None
+
+	def test_fetch_cache_invalidation(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.feature.fetch.cache = True
+
+		assert (functor.Fetch('cached_global', 'default') == 'default')
+
+		this.executor.SetGlobal('cached_global', 'global')
+		assert (functor.Fetch('cached_global', 'default') == 'global')
+
+		this.executor.ExpireGlobal('cached_global')
+		assert (functor.Fetch('cached_global', 'default') == 'default')
+
+		functor.Set('cached_member', 'member')
+		assert (functor.Fetch('cached_member', 'default') == 'member')
+
+	def test_fetch_miss_cache(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+
+		assert (functor.Fetch('cached_dotted.value', 'default', ['globals']) == 'default')
+		assert (eons.FetchCache.IsMiss('globals', 'cached_dotted.value'))
+
+		this.executor.SetGlobal('cached_dotted', {'value': 'global'})
+		assert (not eons.FetchCache.IsMiss('globals', 'cached_dotted.value'))
+		assert (functor.Fetch('cached_dotted.value', 'default', ['globals']) == 'global')
+		this.executor.ExpireGlobal('cached_dotted')
+
+		# Plain names are never cached.
+		import builtins
+		builtins.cached_plain = 'plain'
+		assert (functor.Fetch('cached_plain', 'default', ['globals']) == 'plain')
+		del builtins.cached_plain
+		assert (functor.Fetch('cached_plain', 'default', ['globals']) == 'default')
+
+	def test_attr_cache(this):
+		precursor = this.executor.GetRegistered('HelloFunctor')
+		precursor.Initialize()
+
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.feature.fetch.attrCache = True
+		functor.precursor = precursor
+		functor.InvalidateFetchCache()
+
+		functor.result.data = eons.util.DotDict({'attr_result': 'result'})
+		assert (functor.attr_result == 'result')
+
+		assert (not hasattr(functor, 'attr_passthrough'))
+		cached = functor.cache.attr['attr_passthrough']
+
+		# Misses are remembered when something else changes...
+		precursor.Set('attr_unrelated', 'set')
+		this.executor.SetGlobal('attr_unrelated', 'global')
+		assert (functor.cache.attr['attr_passthrough'] is cached)
+		assert (cached[0] == eons.FetchCache.GetVersion('attr_passthrough'))
+		this.executor.ExpireGlobal('attr_unrelated')
+
+		# ...but not when the attribute is Set().
+		precursor.Set('attr_passthrough', 'set')
+		assert (functor.attr_passthrough == 'set')
+
+		# Changing where attributes come from drops everything.
+		other = this.executor.GetRegistered('HelloFunctor')
+		other.Initialize()
+		other.attr_passthrough = 'other'
+		functor.Set('precursor', other)
+		assert (functor.attr_passthrough == 'other')
+
+	def test_attr_direct_assignment(this):
+		precursor = this.executor.GetRegistered('HelloFunctor')
+		precursor.Initialize()
+
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.precursor = precursor
+
+		# Without feature.fetch.attrCache, directly assigned attributes are found right after a miss.
+		assert (not hasattr(functor, 'attr_shared'))
+		precursor.attr_shared = 3
+		assert (functor.attr_shared == 3)
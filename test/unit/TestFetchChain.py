@@ -0,0 +1,111 @@
+from StandardTestFixture import StandardTestFixture
+import threading
+import eons
+
+class TestFetchChain(StandardTestFixture):
+
+	def MakeChain(this, length):
+		chain = []
+		for i in range(length):
+			functor = this.executor.GetRegistered('HelloFunctor')
+			functor.Initialize()
+			functor.executor = this.executor
+			if (chain):
+				functor.precursor = chain[-1]
+			chain.append(functor)
+		return chain
+
+	def test_deep_chain(this):
+		chain = this.MakeChain(200)
+		chain[0].chain_test_value = 'first'
+		chain[-1].fetch.depth = 1000
+
+		assert (chain[-1].Fetch('chain_test_value', 'default') == 'first')
+
+		# Beyond the maximum depth, the first Functor is not searched.
+		for functor in chain:
+			functor.fetch.depth = 10
+		chain[-1].InvalidateFetchCache()
+		assert (chain[-1].Fetch('chain_test_value', 'default') == 'default')
+
+	def test_cycle(this):
+		chain = this.MakeChain(3)
+		chain[0].precursor = chain[-1]
+		chain[0].caller = chain[1]
+		chain[-1].fetch.use.insert(3, 'caller')
+		chain[-1].InvalidateFetchCache()
+
+		assert (chain[-1].Fetch('chain_test_missing', 'default') == 'default')
+
+		chain[1].chain_test_value = 'middle'
+		assert (chain[-1].Fetch('chain_test_value', 'default') == 'middle')
+
+	def test_changed_chain(this):
+		chain = this.MakeChain(3)
+		chain[0].chain_test_value = 'first'
+		assert (chain[-1].Fetch('chain_test_value', 'default') == 'first')
+
+		# Hops are checked each Fetch, even if they were changed directly.
+		other = this.MakeChain(1)[0]
+		other.chain_test_value = 'other'
+		chain[1].precursor = other
+		assert (chain[-1].Fetch('chain_test_value', 'default') == 'other')
+
+		chain[1].precursor = None
+		assert (chain[-1].Fetch('chain_test_value', 'default') == 'default')
+
+	def test_callbacks(this):
+		chain = this.MakeChain(3)
+		chain[0].chain_test_value = 'first'
+
+		locations = []
+		for functor in chain:
+			# Only find chain_test_value by walking (not through __getattr__).
+			functor.fetch.attr.use = []
+			functor.callback.fetch = lambda varName, location, value, functor=functor: locations.append((functor, location)) if varName == 'chain_test_value' else None
+
+		assert (chain[-1].Fetch('chain_test_value', 'default') == 'first')
+		assert (locations[-3:] == [(chain[0], 'this'), (chain[1], 'precursor'), (chain[2], 'precursor')])
+
+	def test_linear_scope(this):
+		# Searching each Functor in the chain should not walk the rest of the chain again (e.g. through __getattr__).
+		steps = []
+		for length in [50, 100, 200]:
+			chain = this.MakeChain(length)
+			for functor in chain:
+				functor.fetch.depth = 1000
+			assert (chain[-1].Fetch('chain_test_missing', 'default') == 'default')
+			steps.append(sum(len(scope.steps) for functor in chain for scope in functor.cache.fetch.scopes.values()))
+
+		assert (steps[1] <= 2.5 * steps[0])
+		assert (steps[2] <= 2.5 * steps[1])
+
+	def test_threads(this):
+		chain = this.MakeChain(2)
+		chain[0].chain_test_value = 'first'
+
+		# Fetch on another thread while chain[1] is still walking the chain.
+		seen = {}
+		def Other():
+			seen['other'] = eons.Functor.GetAttrFetches()
+			seen['value'] = chain[1].Fetch('chain_test_value', 'default')
+
+		def Callback(varName, location, value):
+			if (varName != 'chain_test_value' or 'other' in seen):
+				return
+			state = eons.Functor.GetAttrFetches()
+			thread = threading.Thread(target=Other)
+			thread.start()
+			thread.join()
+			seen['state'] = state
+			seen['after'] = eons.Functor.GetAttrFetches()
+
+		chain[0].callback.fetch = Callback
+		assert (chain[1].Fetch('chain_test_value', 'default') == 'first')
+
+		# Each thread has its own state, which the other can neither see nor clear.
+		assert (seen['state'] is not None)
+		assert (seen['other'] is None)
+		assert (seen['value'] == 'first')
+		assert (seen['after'] is seen['state'])
+		assert (eons.Functor.GetAttrFetches() is None)
@@ -0,0 +1,52 @@
+import os
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestFetchConfig(StandardTestFixture):
+
+	def test_config_lookup(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.config = {
+			'port': 3306,
+			'service.name': 'flat',
+			'service': {
+				'name': 'nested',
+				'mysql': {
+					'port': 3307
+				}
+			}
+		}
+
+		assert (functor.Fetch('port', fetchFrom=['config']) == 3306)
+		assert (functor.Fetch('service.mysql.port', 'default', fetchFrom=['config']) == 'default')
+
+		functor.feature.fetch.dotted = True
+		assert (functor.Fetch('service.mysql.port', 'default', fetchFrom=['config']) == 3307)
+		assert (functor.Fetch('service.name', 'default', fetchFrom=['config']) == 'flat')
+		assert (functor.Fetch('service.mysql.host', 'default', fetchFrom=['config']) == 'default')
+
+		del functor.config
+
+	def test_args_lookup(this):
+		this.executor.extraArgs = {'extra_arg': 'executor'}
+		assert (this.executor.Fetch('extra_arg', fetchFrom=['args']) == 'executor')
+		this.executor.extraArgs = {}
+
+	def test_environment_lookup(this):
+		os.environ['EONS_TEST_ENVIRONMENT'] = 'upper'
+		assert (this.executor.Fetch('eons_test_environment', fetchFrom=['environment']) is None)
+
+		this.executor.RefreshEnvironment()
+		assert (this.executor.Fetch('eons_test_environment', fetchFrom=['environment']) == 'upper')
+		assert (this.executor.GetEnvironmentVariable('eons_test_environment') == ('upper', True))
+		assert (this.executor.GetEnvironmentVariable('eons_test_missing', 'default') == ('default', False))
+
+		this.executor.default.environment.prefix = 'EONS_'
+		this.executor.RefreshEnvironment()
+		assert (this.executor.Fetch('test_environment', fetchFrom=['environment']) == 'upper')
+		assert (this.executor.Fetch('path', fetchFrom=['environment']) is None)
+
+		del os.environ['EONS_TEST_ENVIRONMENT']
+		this.executor.default.environment.prefix = ''
+		this.executor.RefreshEnvironment()
@@ -0,0 +1,40 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestFetchMany(StandardTestFixture):
+
+	def test_fetch_many(this):
+		precursor = this.executor.GetRegistered('HelloFunctor')
+		precursor.Initialize()
+		precursor.kwargs = {'many_precursor': 'precursor', 'many_both': 'precursor'}
+
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.precursor = precursor
+		functor.executor = this.executor
+		functor.kwargs = {'many_args': 'args', 'many_both': 'args'}
+		functor.config = {'many_config': 'config'}
+
+		varNames = ['many_args', 'many_precursor', 'many_both', 'many_config', 'many_missing']
+		defaults = {'many_missing': 'default'}
+
+		fetched = functor.FetchMany(varNames, defaults)
+		for varName in varNames:
+			assert (fetched[varName] == functor.Fetch(varName, defaults.get(varName)))
+		assert (fetched['many_both'] == 'args')
+
+		fetched = functor.FetchMany(varNames, defaults, start=False)
+		assert (fetched['many_precursor'] == ('precursor', True))
+		assert (fetched['many_missing'] == ('default', False))
+
+	def test_fetch_many_callbacks(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.kwargs = {'many_args': 'args'}
+
+		locations = []
+		functor.callback.fetch = lambda varName, location, value: locations.append((varName, location))
+		functor.FetchMany(['many_args', 'many_missing'], fetchFrom=['args'])
+		functor.callback.fetch = None
+
+		assert (locations == [('many_args', 'args'), ('many_missing', 'default')])
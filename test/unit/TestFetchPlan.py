@@ -0,0 +1,33 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestFetchPlan(StandardTestFixture):
+
+	def test_plan_order(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+
+		plan = functor.GetFetchPlan(['args', 'config', 'precursor'], include=['this'], exclude=['precursor'])
+		assert (plan.use == ('args', 'this', 'config'))
+		assert ([loc for loc, location in plan.locations] == ['args', 'this', 'config'])
+
+		# Same combination, same plan.
+		assert (functor.GetFetchPlan(('args', 'config', 'precursor'), ('this',), ('precursor',)) is plan)
+
+	def test_plan_invalidation(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+
+		plan = functor.GetFetchPlan(functor.fetch.use)
+		functor.PopulateFetchLocations()
+		assert (functor.GetFetchPlan(functor.fetch.use) is not plan)
+
+	def test_fetch_with_plan(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.kwargs = {'say_hi_to': 'plans'}
+		functor.plan_test_value = 'this'
+
+		assert (functor.FetchWithout(['args'], 'say_hi_to', 'default') == 'default')
+		assert (functor.FetchWith(['args'], 'say_hi_to', 'default', currentFetchFrom=[]) == 'plans')
+		assert (functor.FetchWithAndWithout(['this'], ['args'], 'plan_test_value', 'default', currentFetchFrom=['args']) == 'this')
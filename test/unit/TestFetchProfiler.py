@@ -0,0 +1,40 @@
+from StandardTestFixture import StandardTestFixture
+import json
+import eons
+
+class TestFetchProfiler(StandardTestFixture):
+
+	def test_fetch_profile(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+		functor.kwargs = {'profiled_arg': 'args'}
+		functor.fetch.use = ['this', 'args']
+		functor.profiled_member = 'this'
+
+		eons.FetchProfiler.Reset()
+		eons.FetchProfiler.Enable()
+		try:
+			for i in range(3):
+				functor.Fetch('profiled_arg')
+			functor.Fetch('profiled_member')
+			functor.FetchMany(['profiled_arg', 'profiled_missing'])
+		finally:
+			eons.FetchProfiler.Disable()
+
+		# Not recorded.
+		functor.Fetch('profiled_arg')
+
+		report = json.loads(eons.FetchProfiler.GetJson())
+		fetches = {fetch['varName']: fetch for fetch in report['fetches'] if fetch['class'] == 'HelloFunctor'}
+
+		assert (fetches['profiled_arg']['calls'] == 4)
+		assert (fetches['profiled_arg']['locations'] == {'args': 4})
+		assert (fetches['profiled_arg']['tried'] == 4)
+		assert (fetches['profiled_member']['locations'] == {'this': 1})
+		assert (fetches['profiled_missing']['defaults'] == 1)
+
+		# args answered most often, so it should be tried first.
+		assert (report['suggestions']['HelloFunctor'] == ['args', 'this'])
+
+		assert ('profiled_arg' in eons.FetchProfiler.GetTable())
+		eons.FetchProfiler.Reset()
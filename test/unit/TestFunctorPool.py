@@ -0,0 +1,63 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class PooledFunctor(eons.StandardFunctor):
+	def __init__(this, name="PooledFunctor"):
+		super().__init__(name)
+		this.feature.autoReturn = False
+		this.arg.kw.optional['pool_depth'] = 0
+
+	def Function(this):
+		ret = [this]
+		if (this.pool_depth > 0):
+			ret += this.executor.Execute('PooledFunctor', pool_depth=this.pool_depth - 1)
+		ret.append(this.pool_depth)
+		return ret
+
+class AutoReturnPooledFunctor(eons.StandardFunctor):
+	def __init__(this, name="AutoReturnPooledFunctor"):
+		super().__init__(name)
+		this.arg.kw.required.append('pool_value')
+
+	def Function(this):
+		return this.pool_value
+
+class TestFunctorPool(StandardTestFixture):
+
+	def test_pool(this):
+		this.executor.cache.pool = {}
+
+		first = this.executor.Execute('PooledFunctor')
+		second = this.executor.Execute('PooledFunctor')
+		assert (second[0] is first[0])
+
+		# Recursive Executes each get their own Functor, and none clobber the others' args.
+		nested = this.executor.Execute('PooledFunctor', pool_depth=2)
+		functors = [value for value in nested if isinstance(value, eons.Functor)]
+		depths = [value for value in nested if not isinstance(value, eons.Functor)]
+		assert (len(set(map(id, functors))) == 3)
+		assert (depths == [0, 1, 2])
+		assert (len(this.executor.cache.pool['PooledFunctor']) == 3)
+
+		this.executor.default.pool.size = 0
+		this.executor.cache.pool = {}
+		assert (this.executor.Execute('PooledFunctor')[0] is not this.executor.Execute('PooledFunctor')[0])
+		this.executor.default.pool.size = 4
+
+	def test_pool_auto_return(this):
+		this.executor.cache.pool = {}
+
+		# autoReturn Functors return themselves, so they are the caller's to keep.
+		first = this.executor.Execute('AutoReturnPooledFunctor', pool_value=1)
+		assert (first.result.data.returned == 1)
+		assert (not this.executor.cache.pool.get('AutoReturnPooledFunctor'))
+		second = this.executor.Execute('AutoReturnPooledFunctor', pool_value=2)
+		assert (second is not first)
+		assert (second.result.data.returned == 2)
+		assert (first.result.data.returned == 1)
+
+		# Incomplete Functors belong to the caller until they are completed.
+		incomplete = this.executor.Execute('AutoReturnPooledFunctor')
+		assert (incomplete.incomplete)
+		assert (not this.executor.cache.pool.get('AutoReturnPooledFunctor'))
+		assert (this.executor.Execute('AutoReturnPooledFunctor', pool_value=3) is not incomplete)
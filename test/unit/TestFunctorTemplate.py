@@ -0,0 +1,55 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TemplatedFunctor(eons.StandardFunctor):
+	def __init__(this, name="TemplatedFunctor"):
+		super().__init__(name)
+		this.arg.kw.required.append('templated_arg')
+		this.arg.kw.required.append('templated_arg')
+		this.arg.kw.required.append('templated_optional')
+		this.arg.kw.optional['templated_optional'] = None
+		this.program.required.append('python3')
+
+class TestFunctorTemplate(StandardTestFixture):
+
+	def test_template(this):
+		first = TemplatedFunctor()
+		first.Initialize()
+		assert (first.arg.kw.required == ['templated_arg'])
+		assert (first.program.required == ['python3'])
+
+		templates = len(eons.Functor.templates)
+		second = TemplatedFunctor()
+		second.Initialize()
+		assert (len(eons.Functor.templates) == templates)
+		assert (second.arg.kw.required == ['templated_arg'])
+
+		# Each Functor gets its own lists.
+		assert (second.arg.kw.required is not first.arg.kw.required)
+
+		# Functors constructed differently get their own template.
+		third = TemplatedFunctor()
+		third.program.required.append('this-program-does-not-exist')
+		try:
+			third.Initialize()
+			assert False
+		except eons.FunctorError:
+			pass
+
+	def test_template_locations_and_coercers(this):
+		first = TemplatedFunctor()
+		first.arg.type['templated_arg'] = int
+		first.Initialize()
+		second = TemplatedFunctor()
+		second.arg.type['templated_arg'] = int
+		second.Initialize()
+
+		# Fetch locations are bound to each Functor.
+		assert (first.fetch.locations['this'].__self__ is first)
+		assert (second.fetch.locations['this'].__self__ is second)
+		assert (second.fetch.locations.keys() == first.fetch.locations.keys())
+
+		# Coercers are looked up once per template.
+		assert (second.cache.coercers['templated_arg'] is first.cache.coercers['templated_arg'])
+		second.Set('templated_arg', '3')
+		assert (second.templated_arg == 3)
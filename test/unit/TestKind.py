@@ -1,7 +1,42 @@
 from StandardTestFixture import StandardTestFixture
+import eons
 
 class TestKindFixture(StandardTestFixture):
 
 	def test_kind(this):
 		kindResult = this.executor.Execute('KindFunctor').kind_result
 		assert (kindResult == "HelloFunctor (external) says hello to simplicity!")
+
+	def test_kind_source_class(this):
+		kindFunctor = this.executor.GetRegistered('KindFunctor')
+		cls = type(kindFunctor)
+		assert (cls.__init__.__source_class__ is cls)
+
+		# The class is bound to the constructor; nothing should need to search for it.
+		getCurrentFunction = eons.util.BlackMagick.GetCurrentFunction
+		calls = []
+		def CountCalls():
+			calls.append(1)
+			return getCurrentFunction()
+		eons.util.BlackMagick.GetCurrentFunction = staticmethod(CountCalls)
+		try:
+			instance = cls()
+		finally:
+			eons.util.BlackMagick.GetCurrentFunction = getCurrentFunction
+		assert (not calls)
+		assert (isinstance(instance, cls))
+		assert (instance.sayHelloTo == "simplicity!")
+
+	def test_kind_body(this):
+		@eons.kind(eons.Functor)
+		def KindBody(
+			first,
+			second = 'second',
+		):
+			# Keywords, attributes, and strings which share a name with an arg are left alone.
+			third = dict(first=first, second="second")
+			return f"{third['first']} {third['second']} {second} {len(first)}"
+
+		kindBody = KindBody()
+		kindBody.feature.autoReturn = False
+		assert (kindBody('one', executor=this.executor) == "one second second 3")
@@ -0,0 +1,106 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestMethodBinding(StandardTestFixture):
+
+	def test_method_binding(this):
+		hello = this.executor.GetRegistered('HelloFunctor')
+		definition = hello.classMethods['Hello']
+
+		assert (hello(say_hi_to='you') == 'HelloFunctor says hello to you')
+		bound = hello.methods['Hello']
+		assert (bound is not definition)
+		assert (bound.definition is definition)
+		assert (bound.epidef is hello)
+
+		# The definition is shared, not bound.
+		assert (definition.epidef is None)
+		assert (len(definition.compiled) == 1)
+
+		# Subsequent calls reuse the same binding.
+		assert (hello(say_hi_to='me') == 'HelloFunctor says hello to me')
+		assert (hello.methods['Hello'] is bound)
+
+		# Other instances get their own binding of the same definition.
+		other = this.executor.GetRegistered('HelloFunctor')
+		assert (other(say_hi_to='them') == 'HelloFunctor says hello to them')
+		assert (other.methods['Hello'] is not bound)
+		assert (other.methods['Hello'].definition is definition)
+		assert (other.methods['Hello'].Function.__func__ is bound.Function.__func__)
+
+	def test_inherited_method_binding(this):
+		hello = this.executor.GetRegistered('HelloFunctor')
+		hello()
+		enemy = this.executor.GetRegistered('EnemyFunctor')
+		enemy.executor = this.executor
+
+		greeting = enemy(enemy='Hello', precursor=hello)
+		assert (greeting == 'EnemyFunctor says hello to its Hello Enemy')
+		bound = enemy.methods['Hello']
+		assert (bound.epidef is enemy)
+		assert (bound.definition is hello.classMethods['Hello'])
+
+		# Re-warming does not chain inherited methods onto themselves.
+		enemy(enemy='Hello', precursor=hello)
+		assert (enemy.methods['Hello'] is bound)
+		assert (len(bound.next) == 0)
+
+	def test_method_table(this):
+		hello = this.executor.GetRegistered('HelloFunctor')
+		hello()
+
+		first = this.executor.GetRegistered('EnemyFunctor')
+		first.executor = this.executor
+		first(enemy='First', precursor=hello)
+
+		# The same class, with the same kind of precursor, follows the table of the first, rather than merging methods again.
+		second = this.executor.GetRegistered('EnemyFunctor')
+		second.executor = this.executor
+		merges = []
+		mergeMethods = second.MergeMethods
+		def CountMerges():
+			merges.append(1)
+			return mergeMethods()
+		second.MergeMethods = CountMerges
+
+		greeting = second(enemy='Second', precursor=hello)
+		assert (greeting == 'EnemyFunctor says hello to its Second Enemy')
+		assert (not merges)
+		assert (second.cache.methodTable == first.cache.methodTable)
+		assert (second.methods['Hello'].epidef is second)
+		assert (second.methods['Hello'] is not first.methods['Hello'])
+
+		# Without the precursor, there is nothing to follow.
+		third = this.executor.GetRegistered('HelloFunctor')
+		third()
+		assert (third.cache.methodTable == hello.cache.methodTable)
+		assert (third.cache.methodTable != first.cache.methodTable)
+
+	def test_same_class_precursor(this):
+		first = this.executor.GetRegistered('HelloFunctor')
+		first()
+
+		# The propagated Hello of first is bound to second, alongside the Hello of second; each is its own binding.
+		second = this.executor.GetRegistered('HelloFunctor')
+		for attempt in range(2):
+			assert (second(say_hi_to='you', precursor=first) == 'HelloFunctor says hello to you')
+			hello = second.methods['Hello']
+			assert (len(hello.next) == 1)
+			assert (hello.next[0] is not hello)
+			assert (hello.next[0].epidef is second)
+			assert (len(hello.next[0].next) == 0)
+
+	def test_clear_method_tables(this):
+		first = this.executor.GetRegistered('HelloFunctor')
+		first()
+		assert (eons.Functor.methodTables)
+		assert (eons.Functor.validMethodTables)
+
+		eons.Functor.ClearCaches()
+		assert (not eons.Functor.methodTables)
+		assert (not eons.Functor.validMethodTables)
+
+		# Tables made after clearing never reuse the ids of those before.
+		second = this.executor.GetRegistered('HelloFunctor')
+		assert (second(say_hi_to='you') == 'HelloFunctor says hello to you')
+		assert (second.cache.methodTable != first.cache.methodTable)
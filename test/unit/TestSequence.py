@@ -13,4 +13,18 @@ class TestSequenceFixture(StandardTestFixture):
 
 		sequenceResult = sequenceParent(['HAPPY', 'HAPPY', 'BOOM', 'BOOM', 'SWAMP', 'SWAMP', 'SWAMP!']) / partialFunctor(separator = ', ')
 		sequenceResult = sequenceResult.returned
-		assert (sequenceResult == "HelloFunctor (external) says hello to HAPPY, HAPPY, BOOM, BOOM, SWAMP, SWAMP, SWAMP!")
\ No newline at end of file
+		assert (sequenceResult == "HelloFunctor (external) says hello to HAPPY, HAPPY, BOOM, BOOM, SWAMP, SWAMP, SWAMP!")
+
+	def test_sequence_builder(this):
+		sequenceParent = eons.SelfRegistering('SequenceParentFunctor')
+		partialFunctor = this.executor.GetRegistered('PartialFunctor')
+
+		sequenceParent.executor = this.executor
+		partialFunctor.executor = this.executor
+
+		sequenceResult = eons.sequence(sequenceParent, partialFunctor(separator = ' & '), words=['HAPPY', 'SWAMP!'])
+		assert (sequenceResult.returned == "HelloFunctor (external) says hello to HAPPY & SWAMP!")
+
+		# Only code which uses / is disassembled.
+		assert (eons.Functor.CodePerformsSequence((lambda a, b: a / b).__code__))
+		assert (not eons.Functor.CodePerformsSequence((lambda a, b: a * b).__code__))
@@ -0,0 +1,62 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class WarmCounter(eons.StandardFunctor):
+	def __init__(this, name="WarmCounter"):
+		super().__init__(name)
+		this.arg.kw.optional['warm_value'] = None
+		this.feature.stayWarm = True
+		this.feature.autoReturn = False
+		this.warmUps = 0
+
+	def WarmUp(this, *args, **kwargs):
+		this.warmUps += 1
+		return super().WarmUp(*args, **kwargs)
+
+	def Function(this):
+		return this.warm_value
+
+class ExplicitlyWarmed(eons.StandardFunctor):
+	def __init__(this, name="ExplicitlyWarmed"):
+		super().__init__(name)
+		this.arg.kw.required.append('warmed_value')
+		this.feature.autoReturn = False
+
+	def Function(this):
+		return this.warmed_value
+
+class TestStayWarm(StandardTestFixture):
+
+	def test_stay_warm(this):
+		functor = WarmCounter()
+		functor.executor = this.executor
+
+		assert (functor(warm_value=1) == 1)
+		assert (functor(warm_value=1) == 1)
+		assert (functor.warmUps == 1)
+
+		# Changed values always re-warm, even when the keys are the same.
+		assert (functor(warm_value=2) == 2)
+		assert (functor.warmUps == 2)
+
+		# Unhashable values are compared by identity.
+		value = [1]
+		assert (functor(warm_value=value) == [1])
+		assert (functor(warm_value=value) == [1])
+		assert (functor.warmUps == 3)
+		assert (functor(warm_value=[1]) == [1])
+		assert (functor.warmUps == 4)
+
+		# Changes to the executor re-warm too.
+		this.executor.RefreshEnvironment()
+		functor(warm_value=[1])
+		assert (functor.warmUps == 5)
+
+	def test_explicit_warm_up(this):
+		for stayWarm in [False, True]:
+			functor = ExplicitlyWarmed()
+			functor.feature.stayWarm = stayWarm
+			functor.WarmUp(warmed_value=5, executor=this.executor)
+
+			# A Functor warmed by hand is called as it is, rather than warmed again without its args.
+			assert (functor() == 5)
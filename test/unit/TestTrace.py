@@ -0,0 +1,32 @@
+import logging
+from StandardTestFixture import StandardTestFixture
+import eons
+
+class TestTrace(StandardTestFixture):
+
+	def test_trace_per_class(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		level = logging.getLogger().level
+		logging.getLogger().setLevel(logging.DEBUG)
+		try:
+			assert (eons.Trace.Enabled(functor, logging.DEBUG))
+
+			functor.__class__.tracing = logging.INFO
+			assert (not eons.Trace.Enabled(functor, logging.DEBUG))
+			assert (eons.Trace.Enabled(functor, logging.INFO))
+
+			functor.__class__.tracing = False
+			assert (not eons.Trace.Enabled(functor, logging.CRITICAL))
+
+			# Other classes are unaffected.
+			assert (eons.Trace.Enabled(this.executor, logging.DEBUG))
+
+		finally:
+			logging.getLogger().setLevel(level)
+			if ('tracing' in functor.__class__.__dict__):
+				del functor.__class__.tracing
+
+	def test_trace_event_formatting(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		event = eons.TraceEvent(functor, 'test', "{name} got {value!r}", {'value': 'formatted'})
+		assert (str(event) == "HelloFunctor got 'formatted'")
@@ -0,0 +1,27 @@
+from StandardTestFixture import StandardTestFixture
+import eons
+from eons import util
+
+class TestUtilAttr(StandardTestFixture):
+
+	def test_dotted_attr(this):
+		functor = this.executor.GetRegistered('HelloFunctor')
+		functor.Initialize()
+
+		util.SetAttr(functor, 'util_test_value', 'top')
+		util.SetAttr(functor, 'fetch.util_test_value', 'nested')
+
+		assert (util.GetAttr(functor, 'util_test_value') == 'top')
+		assert (util.GetAttr(functor, 'fetch.util_test_value') == 'nested')
+		assert (functor.fetch.util_test_value == 'nested')
+		assert (util.HasAttr(functor, 'fetch.use'))
+		assert (not util.HasAttr(functor, 'util_missing.util_missing'))
+
+		functor.Set('fetch.util_set_value', 'set')
+		assert (functor.fetch.util_set_value == 'set')
+
+		try:
+			util.GetAttr(functor, 'util_missing.util_missing')
+			assert False
+		except AttributeError:
+			pass